@@ -15,55 +15,66 @@ Usage:
     python component_builder.py interactive clickable-box
     python component_builder.py animation rotating-cube
     python component_builder.py --interactive
+    python component_builder.py --batch components.json
 """
 
-import argparse
 import sys
-from pathlib import Path
+import types
+from functools import lru_cache
 
 # Component templates
 COMPONENT_TEMPLATES = {
     'basic': {
         'description': 'Basic component with schema and lifecycle',
-        'schema_props': ['enabled: boolean', 'speed: number'],
+        'schema_props': ('enabled: boolean', 'speed: number'),
         'has_tick': False
     },
     'interactive': {
         'description': 'Component with mouse/VR interaction events',
-        'schema_props': ['hoverColor: color', 'clickColor: color'],
+        'schema_props': ('hoverColor: color', 'clickColor: color'),
         'has_tick': False
     },
     'animation': {
         'description': 'Component with tick() for continuous animation',
-        'schema_props': ['speed: number', 'axis: string'],
+        'schema_props': ('speed: number', 'axis: string'),
         'has_tick': True
     },
     'physics': {
         'description': 'Component for physics interactions',
-        'schema_props': ['force: number', 'direction: vec3'],
+        'schema_props': ('force: number', 'direction: vec3'),
         'has_tick': True
     },
     'controller': {
         'description': 'VR controller interaction component',
-        'schema_props': ['hand: string', 'button: string'],
+        'schema_props': ('hand: string', 'button: string'),
         'has_tick': False
     },
     'networked': {
         'description': 'Networked component for multi-user scenes',
-        'schema_props': ['syncInterval: number', 'owner: string'],
+        'schema_props': ('syncInterval: number', 'owner: string'),
         'has_tick': True
     },
     'loader': {
         'description': 'Asset loading component',
-        'schema_props': ['src: string', 'onLoad: string'],
+        'schema_props': ('src: string', 'onLoad: string'),
         'has_tick': False
     }
 }
+for _config in COMPONENT_TEMPLATES.values():
+    _config['schema_props_str'] = ', '.join(_config['schema_props'])
+del _config
+COMPONENT_TEMPLATES = types.MappingProxyType(
+    {k: types.MappingProxyType(v) for k, v in COMPONENT_TEMPLATES.items()}
+)
+_TYPE_KEYS = tuple(COMPONENT_TEMPLATES)
 
-def generate_basic_component(name):
-    """Generate basic component template"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+_UNDERSCORE_TABLE = str.maketrans('_', '-')
+
+def _normalize_name(name):
+    """Convert a component name to its dashed A-Frame form"""
+    return name.translate(_UNDERSCORE_TABLE) if '_' in name else name
+
+_BASIC_TEMPLATE = '''// {component_name} Component
 // Basic A-Frame component with schema and lifecycle methods
 
 AFRAME.registerComponent('{component_name}', {{
@@ -121,10 +132,11 @@ AFRAME.registerComponent('{component_name}', {{
 // <a-entity {component_name}="enabled: true; speed: 2; color: #FF0000"></a-entity>
 '''
 
-def generate_interactive_component(name):
-    """Generate interactive component with events"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_basic_component(component_name):
+    """Generate basic component template"""
+    return _BASIC_TEMPLATE.format(component_name=component_name)
+
+_INTERACTIVE_TEMPLATE = '''// {component_name} Component
 // Interactive component with mouse and VR controller events
 
 AFRAME.registerComponent('{component_name}', {{
@@ -221,10 +233,11 @@ AFRAME.registerComponent('{component_name}', {{
 // <a-box class="interactive" {component_name}="hoverColor: yellow; clickColor: red"></a-box>
 '''
 
-def generate_animation_component(name):
-    """Generate animation component with tick()"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_interactive_component(component_name):
+    """Generate interactive component with events"""
+    return _INTERACTIVE_TEMPLATE.format(component_name=component_name)
+
+_ANIMATION_TEMPLATE = '''// {component_name} Component
 // Animation component using tick() for continuous updates
 
 AFRAME.registerComponent('{component_name}', {{
@@ -272,10 +285,11 @@ AFRAME.registerComponent('{component_name}', {{
 // <a-sphere {component_name}="speed: 0.5; axis: x; enabled: false"></a-sphere>
 '''
 
-def generate_physics_component(name):
-    """Generate physics-based component"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_animation_component(component_name):
+    """Generate animation component with tick()"""
+    return _ANIMATION_TEMPLATE.format(component_name=component_name)
+
+_PHYSICS_TEMPLATE = '''// {component_name} Component
 // Physics-based component (requires aframe-physics-system)
 
 AFRAME.registerComponent('{component_name}', {{
@@ -354,10 +368,11 @@ AFRAME.registerComponent('{component_name}', {{
 // </a-scene>
 '''
 
-def generate_controller_component(name):
-    """Generate VR controller component"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_physics_component(component_name):
+    """Generate physics-based component"""
+    return _PHYSICS_TEMPLATE.format(component_name=component_name)
+
+_CONTROLLER_TEMPLATE = '''// {component_name} Component
 // VR controller interaction component
 
 AFRAME.registerComponent('{component_name}', {{
@@ -444,10 +459,11 @@ AFRAME.registerComponent('{component_name}', {{
 // </a-entity>
 '''
 
-def generate_networked_component(name):
-    """Generate networked component"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_controller_component(component_name):
+    """Generate VR controller component"""
+    return _CONTROLLER_TEMPLATE.format(component_name=component_name)
+
+_NETWORKED_TEMPLATE = '''// {component_name} Component
 // Networked component for multi-user synchronization (requires networked-aframe)
 
 AFRAME.registerComponent('{component_name}', {{
@@ -534,10 +550,11 @@ AFRAME.registerComponent('{component_name}', {{
 // </a-scene>
 '''
 
-def generate_loader_component(name):
-    """Generate asset loading component"""
-    component_name = name.replace('_', '-')
-    return f'''// {component_name} Component
+def generate_networked_component(component_name):
+    """Generate networked component"""
+    return _NETWORKED_TEMPLATE.format(component_name=component_name)
+
+_LOADER_TEMPLATE = '''// {component_name} Component
 // Asset loading component with progress and error handling
 
 AFRAME.registerComponent('{component_name}', {{
@@ -673,19 +690,24 @@ AFRAME.registerComponent('{component_name}', {{
 // <a-entity {component_name}="src: texture.jpg"></a-entity>
 '''
 
+def generate_loader_component(component_name):
+    """Generate asset loading component"""
+    return _LOADER_TEMPLATE.format(component_name=component_name)
+
+_GENERATORS = {
+    'basic': generate_basic_component,
+    'interactive': generate_interactive_component,
+    'animation': generate_animation_component,
+    'physics': generate_physics_component,
+    'controller': generate_controller_component,
+    'networked': generate_networked_component,
+    'loader': generate_loader_component
+}
+
+@lru_cache(maxsize=256)
 def generate_component(component_type, name):
     """Generate component based on type"""
-    generators = {
-        'basic': generate_basic_component,
-        'interactive': generate_interactive_component,
-        'animation': generate_animation_component,
-        'physics': generate_physics_component,
-        'controller': generate_controller_component,
-        'networked': generate_networked_component,
-        'loader': generate_loader_component
-    }
-
-    return generators[component_type](name)
+    return _GENERATORS[component_type](_normalize_name(name))
 
 def interactive_mode():
     """Interactive component builder"""
@@ -698,7 +720,7 @@ def interactive_mode():
     while True:
         try:
             choice = input("\nSelect component type (1-7): ").strip()
-            component_type = list(COMPONENT_TEMPLATES.keys())[int(choice) - 1]
+            component_type = _TYPE_KEYS[int(choice) - 1]
             break
         except (ValueError, IndexError):
             print("Invalid choice. Please enter a number between 1 and 7.")
@@ -713,23 +735,84 @@ def interactive_mode():
     save_component(component_type, name, output_file)
 
 def save_component(component_type, name, output_file):
-    """Save generated component to file"""
-    component_code = generate_component(component_type, name)
+    """Save generated component to file, or write it to stdout when output_file is '-'"""
+    component_name = _normalize_name(name)
+    component_code = generate_component(component_type, component_name)
+
+    if output_file == '-':
+        sys.stdout.write(component_code)
+        sys.stderr.write(f"✅ Generated {component_type} component: {component_name}\n")
+        return
+
+    from pathlib import Path
 
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        f.write(component_code)
+    output_path.write_text(component_code, encoding='utf-8', newline='\n')
+
+    sys.stdout.write(
+        f"\n✅ Generated {component_type} component: {output_path}\n"
+        f"📝 Component name: {component_name}\n"
+        f"🎯 Template: {COMPONENT_TEMPLATES[component_type]['description']}\n"
+        f"\n🚀 To use:\n"
+        f"   1. Include in HTML: <script src=\"{output_file}\"></script>\n"
+        f"   2. Attach to entity: <a-entity {component_name}></a-entity>\n"
+    )
 
-    print(f"\n✅ Generated {component_type} component: {output_path}")
-    print(f"📝 Component name: {name.replace('_', '-')}")
-    print(f"🎯 Template: {COMPONENT_TEMPLATES[component_type]['description']}")
-    print(f"\n🚀 To use:")
-    print(f"   1. Include in HTML: <script src=\"{output_file}\"></script>")
-    print(f"   2. Attach to entity: <a-entity {name.replace('_', '-')}></a-entity>")
+def _batch_jobs(specs):
+    """Validate batch specs and resolve them to (type, name, output path) jobs"""
+    from pathlib import Path
+
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+        raise ValueError("expected a JSON list of {type, name, output} objects")
+
+    jobs = []
+    for spec in specs:
+        component_type = spec['type']
+        name = spec['name']
+        output = spec.get('output')
+        if not isinstance(component_type, str):
+            raise ValueError(f"'type' must be a string, got {component_type!r}")
+        if not isinstance(name, str):
+            raise ValueError(f"'name' must be a string, got {name!r}")
+        if output is not None and not isinstance(output, str):
+            raise ValueError(f"'output' must be a string, got {output!r}")
+        if component_type not in COMPONENT_TEMPLATES:
+            raise ValueError(f"Unknown component type: {component_type}")
+        if output == '-':
+            raise ValueError("output '-' (stdout) is not supported in batch mode")
+        component_name = _normalize_name(name)
+        jobs.append((component_type, component_name, Path(output or f"{component_name}.js")))
+    return jobs
+
+def _write_components(jobs):
+    """Write resolved batch jobs, creating each output directory once"""
+    for parent in {output_path.parent for _, _, output_path in jobs}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    for component_type, component_name, output_path in jobs:
+        component_code = generate_component(component_type, component_name)
+        output_path.write_text(component_code, encoding='utf-8', newline='\n')
+
+    noun = 'component' if len(jobs) == 1 else 'components'
+    print(f"\n✅ Generated {len(jobs)} {noun}:")
+    for component_type, component_name, output_path in jobs:
+        print(f"   {output_path} ({component_type}: {component_name})")
+
+def save_components(specs):
+    """Save several generated components, validating every spec before writing any"""
+    _write_components(_batch_jobs(specs))
 
 def main():
+    # Fast path for the common `component_builder.py <type> <name>` call
+    argv = sys.argv
+    if len(argv) == 3 and argv[1] in COMPONENT_TEMPLATES and not argv[2].startswith('-'):
+        save_component(argv[1], argv[2], 'component.js')
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Generate A-Frame custom component boilerplate',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -738,7 +821,12 @@ Examples:
   python component_builder.py basic my-component
   python component_builder.py interactive clickable-box --output components/
   python component_builder.py animation rotating-object
+  python component_builder.py basic my-component -o - > my-component.js
   python component_builder.py --interactive
+  python component_builder.py --batch components.json
+
+Batch file format (output defaults to <name>.js):
+  [{"type": "basic", "name": "my-component", "output": "components/my-component.js"}]
 
 Component Types:
   basic       - Basic component with schema
@@ -754,7 +842,7 @@ Component Types:
     parser.add_argument(
         'component_type',
         nargs='?',
-        choices=list(COMPONENT_TEMPLATES.keys()),
+        choices=_TYPE_KEYS,
         help='Type of component to generate'
     )
 
@@ -767,7 +855,7 @@ Component Types:
     parser.add_argument(
         '-o', '--output',
         default='component.js',
-        help='Output filename (default: component.js)'
+        help="Output filename, or '-' for stdout (default: component.js)"
     )
 
     parser.add_argument(
@@ -776,6 +864,12 @@ Component Types:
         help='Run in interactive mode'
     )
 
+    parser.add_argument(
+        '-b', '--batch',
+        metavar='SPECS_JSON',
+        help='Generate components from a JSON list of {type, name, output} objects'
+    )
+
     parser.add_argument(
         '-l', '--list',
         action='store_true',
@@ -785,13 +879,32 @@ Component Types:
     args = parser.parse_args()
 
     if args.list:
-        print("\nAvailable Component Types:\n")
+        lines = ["\nAvailable Component Types:\n"]
         for comp_type, config in COMPONENT_TEMPLATES.items():
-            print(f"  {comp_type:12} - {config['description']}")
-            print(f"                 Schema props: {', '.join(config['schema_props'])}")
-            print(f"                 Has tick(): {'Yes' if config['has_tick'] else 'No'}\n")
+            lines.append(f"  {comp_type:12} - {config['description']}")
+            lines.append(f"                 Schema props: {config['schema_props_str']}")
+            lines.append(f"                 Has tick(): {'Yes' if config['has_tick'] else 'No'}\n")
+        sys.stdout.write('\n'.join(lines) + '\n')
         sys.exit(0)
 
+    if args.batch:
+        import json
+
+        try:
+            with open(args.batch, encoding='utf-8') as f:
+                specs = json.load(f)
+            jobs = _batch_jobs(specs)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            print(f"Error: Invalid batch spec: {e}")
+            sys.exit(1)
+
+        try:
+            _write_components(jobs)
+        except OSError as e:
+            print(f"Error: Failed to write components: {e}")
+            sys.exit(1)
+        return
+
     if args.interactive or not args.component_type or not args.name:
         interactive_mode()
     else:
@@ -15,23 +15,24 @@ Usage:
 import argparse
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Tuple
 
 
-def generate_fountain_particles(count: int = 5000) -> str:
-    """Generate fountain particle system"""
-    return f"""<!DOCTYPE html>
+# Page shell shared by every effect; each effect dict below fills the
+# placeholders with its settings and its setup/update scripts
+_SHELL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Fountain Particles</title>
+    <title>PixiJS {heading}</title>
     <style>
         body {{
             margin: 0;
             padding: 0;
             overflow: hidden;
-            background: #0a0a0a;
+            background: {css_background};
         }}
         #info {{
             position: absolute;
@@ -47,28 +48,41 @@ def generate_fountain_particles(count: int = 5000) -> str:
 </head>
 <body>
     <div id="info">
-        <h3>Fountain Particles</h3>
-        <p>Particles: {count}</p>
+        <h3>{heading}</h3>
+        <p>{info}</p>
         <p>FPS: <span id="fps">--</span></p>
     </div>
 
     <script src="https://pixijs.download/release/pixi.js"></script>
     <script>
         (async () => {{
+            // xorshift32 PRNG for the per-particle randomness; seeded once per page
+            let rngState = (Math.random() * 0x100000000) >>> 0 || 0x9E3779B9;
+            const rng = () => {{
+                rngState ^= rngState << 13;
+                rngState ^= rngState >>> 17;
+                rngState ^= rngState << 5;
+                return (rngState >>> 0) / 4294967296;
+            }};
+
             const app = new PIXI.Application();
 
             await app.init({{
                 width: 800,
                 height: 600,
-                backgroundColor: 0x0a0a0a,
-                antialias: true
+                {background_option},
+                antialias: true{renderer_options}
             }});
 
             document.body.appendChild(app.canvas);
 
+            // FPS readout, looked up once and refreshed every 16th frame
+            const fpsEl = document.getElementById('fps');
+            let fpsFrame = 0;
+
             // Create particle texture
             const graphics = new PIXI.Graphics();
-            graphics.circle(5, 5, 5).fill(0xffffff);
+            graphics.circle({radius}, {radius}, {radius}).fill(0xffffff);
             const particleTexture = app.renderer.generateTexture(graphics);
 
             // Create particle container
@@ -76,641 +90,678 @@ def generate_fountain_particles(count: int = 5000) -> str:
                 maxSize: {count},
                 dynamicProperties: {{
                     position: true,
-                    scale: true,
-                    rotation: false,
-                    color: true
+                    scale: {scale},
+                    rotation: {rotation},
+                    color: {color}
                 }}
             }});
 
             app.stage.addChild(particles);
 
-            // Particle data
-            const particleData = [];
+            const count = {count};
+
+{setup_js}            app.ticker.add((ticker) => {{
+                const dt = ticker.deltaTime;
+
+{update_js}                if ((++fpsFrame & 15) === 0) {{
+                    fpsEl.textContent = app.ticker.FPS.toFixed(0);
+                }}
+            }});
+{after_js}        }})();
+    </script>
+</body>
+</html>"""
 
-            for (let i = 0; i < {count}; i++) {{
-                const particle = new PIXI.Particle({{
+_WEBGPU_PREFERENCE = """,
+                // WebGPU where the browser supports it, WebGL otherwise
+                preference: 'webgpu'"""
+
+_FOUNTAIN_STATE_JS = """\
+            // Hot per-particle state interleaved as x, y, vx, vy, life (stride 5),
+            // with the packed tint in a Uint32 view over the tail of the same buffer
+            const STRIDE = 5, X = 0, Y = 1, VX = 2, VY = 3, LIFE = 4;
+            const hotBuf = new ArrayBuffer(count * (STRIDE * 4 + 4));
+            const H = new Float32Array(hotBuf, 0, count * STRIDE);
+            const T = new Uint32Array(hotBuf, count * STRIDE * 4, count);
+            const sprites = new Array(count);
+            const gravity = 0.2;
+
+"""
+
+_FOUNTAIN_INIT_JS = """\
+            function initParticle(i) {
+                const b = i * STRIDE;
+                H[b + X] = 400;
+                H[b + Y] = 550;
+                H[b + VX] = (rng() - 0.5) * 8;
+                H[b + VY] = -(rng() * 12 + 8);
+                H[b + LIFE] = 1.0;
+            }
+
+            for (let i = 0; i < count; i++) {
+                const particle = new PIXI.Particle({
                     texture: particleTexture,
                     x: 400,
                     y: 550
-                }});
+                });
 
                 particles.addParticle(particle);
-
-                particleData.push({{
-                    particle,
-                    vx: (Math.random() - 0.5) * 8,
-                    vy: -(Math.random() * 12 + 8),
-                    life: 1.0,
-                    gravity: 0.2
-                }});
-            }}
+                sprites[i] = particle;
+                initParticle(i);
+            }
 
             // Update loop
-            app.ticker.add((ticker) => {{
-                particleData.forEach(data => {{
+"""
+
+_FOUNTAIN_UPDATE_JS = """\
+                for (let i = 0; i < count; i++) {
+                    const b = i * STRIDE;
+                    const particle = sprites[i];
+
                     // Physics
-                    data.particle.x += data.vx * ticker.deltaTime;
-                    data.particle.y += data.vy * ticker.deltaTime;
-                    data.vy += data.gravity * ticker.deltaTime;
+                    H[b + X] += H[b + VX] * dt;
+                    H[b + Y] += H[b + VY] * dt;
+                    H[b + VY] += gravity * dt;
 
                     // Fade out
-                    data.life -= 0.01 * ticker.deltaTime;
-
-                    if (data.life > 0) {{
-                        const color = Math.floor(data.life * 255);
-                        data.particle.tint = (color << 16) | (color << 8) | 255;
-                        data.particle.alpha = data.life;
-                    }} else {{
+                    H[b + LIFE] -= 0.01 * dt;
+                    const life = H[b + LIFE];
+
+                    if (life > 0) {
+                        const color = Math.floor(life * 255);
+                        T[i] = (color << 16) | (color << 8) | 255;
+                        particle.tint = T[i];
+                        particle.alpha = life;
+                    } else {
                         // Reset particle
-                        data.particle.x = 400;
-                        data.particle.y = 550;
-                        data.vx = (Math.random() - 0.5) * 8;
-                        data.vy = -(Math.random() * 12 + 8);
-                        data.life = 1.0;
-                    }}
-                }});
-
-                // Update FPS
-                document.getElementById('fps').textContent = Math.round(app.ticker.FPS);
-            }});
-        }})();
-    </script>
-</body>
-</html>"""
+                        initParticle(i);
+                    }
 
+                    particle.x = H[b + X];
+                    particle.y = H[b + Y];
+                }
 
-def generate_fire_particles(count: int = 2000) -> str:
-    """Generate fire particle system"""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Fire Particles</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #1a0a00;
-        }}
-        #info {{
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Fire Particles</h3>
-        <p>Particles: {count}</p>
-        <p>FPS: <span id="fps">--</span></p>
-    </div>
-
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {{
-            const app = new PIXI.Application();
+"""
 
-            await app.init({{
-                width: 800,
-                height: 600,
-                backgroundColor: 0x1a0a00,
-                antialias: true
-            }});
+_FOUNTAIN = {
+    'heading': 'Fountain Particles',
+    'css_background': '#0a0a0a',
+    'background_option': 'backgroundColor: 0x0a0a0a',
+    'renderer_options': _WEBGPU_PREFERENCE,
+    'radius': 5,
+    'scale': 'false',
+    'rotation': 'false',
+    'color': 'true',
+    'setup_js': _FOUNTAIN_STATE_JS + _FOUNTAIN_INIT_JS,
+    'update_js': _FOUNTAIN_UPDATE_JS,
+    'after_js': ''
+}
 
-            document.body.appendChild(app.canvas);
+# Fountain physics for --backend wasm, assembled ahead of time from:
+#
+#   (module
+#     (import "env" "memory" (memory 1))
+#     (func (export "update_fountain") (param $ptr i32) (param $count i32) (param $dt f32)
+#       (local $end i32)
+#       (local.set $end (i32.add (local.get $ptr) (i32.mul (local.get $count) (i32.const 20))))
+#       (block
+#         (loop
+#           (br_if 1 (i32.ge_u (local.get $ptr) (local.get $end)))
+#           ;; x += vx * dt
+#           (f32.store offset=0 (local.get $ptr)
+#             (f32.add (f32.load offset=0 (local.get $ptr))
+#                      (f32.mul (f32.load offset=8 (local.get $ptr)) (local.get $dt))))
+#           ;; y += vy * dt
+#           (f32.store offset=4 (local.get $ptr)
+#             (f32.add (f32.load offset=4 (local.get $ptr))
+#                      (f32.mul (f32.load offset=12 (local.get $ptr)) (local.get $dt))))
+#           ;; vy += gravity * dt
+#           (f32.store offset=12 (local.get $ptr)
+#             (f32.add (f32.load offset=12 (local.get $ptr))
+#                      (f32.mul (f32.const 0.2) (local.get $dt))))
+#           ;; life -= 0.01 * dt
+#           (f32.store offset=16 (local.get $ptr)
+#             (f32.sub (f32.load offset=16 (local.get $ptr))
+#                      (f32.mul (f32.const 0.01) (local.get $dt))))
+#           (local.set $ptr (i32.add (local.get $ptr) (i32.const 20)))
+#           (br 0)))))
+_FOUNTAIN_WASM_B64 = (
+    'AGFzbQEAAAABBwFgA39/fQACDwEDZW52Bm1lbW9yeQIAAQMCAQAHEwEPdXBkYXRl'
+    'X2ZvdW50YWluAAAKcgFwAQF/IAAgAUEUbGohAwJAA0AgACADTw0BIAAgACoCACAA'
+    'KgIIIAKUkjgCACAAIAAqAgQgACoCDCAClJI4AgQgACAAKgIMQ83MTD4gApSSOAIM'
+    'IAAgACoCEEMK1yM8IAKUkzgCECAAQRRqIQAMAAsLCw=='
+)
+
+_FOUNTAIN_WASM_STATE_JS = """\
+            // Hot per-particle state interleaved as x, y, vx, vy, life (stride 5),
+            // held in WebAssembly memory so the module integrates it in place
+            const STRIDE = 5, X = 0, Y = 1, VX = 2, VY = 3, LIFE = 4;
+            const memory = new WebAssembly.Memory({
+                initial: Math.max(1, Math.ceil(count * STRIDE * 4 / 65536))
+            });
+            const wasm = await WebAssembly.instantiate(
+                Uint8Array.from(atob('""" + _FOUNTAIN_WASM_B64 + """'), (c) => c.charCodeAt(0)),
+                { env: { memory } }
+            );
+            const updateFountain = wasm.instance.exports.update_fountain;
+            const H = new Float32Array(memory.buffer, 0, count * STRIDE);
+            const T = new Uint32Array(count);
+            const sprites = new Array(count);
 
-            // Create particle texture
-            const graphics = new PIXI.Graphics();
-            graphics.circle(8, 8, 8).fill(0xffffff);
-            const particleTexture = app.renderer.generateTexture(graphics);
+"""
 
-            // Create particle container
-            const particles = new PIXI.ParticleContainer({{
-                maxSize: {count},
-                dynamicProperties: {{
-                    position: true,
-                    scale: true,
-                    rotation: true,
-                    color: true
-                }}
-            }});
+_FOUNTAIN_WASM_UPDATE_JS = """\
+                // Position, velocity and life are integrated by the WebAssembly module
+                updateFountain(0, count, dt);
+
+                for (let i = 0; i < count; i++) {
+                    const b = i * STRIDE;
+                    const particle = sprites[i];
+                    const life = H[b + LIFE];
+
+                    if (life > 0) {
+                        const color = Math.floor(life * 255);
+                        T[i] = (color << 16) | (color << 8) | 255;
+                        particle.tint = T[i];
+                        particle.alpha = life;
+                    } else {
+                        // Reset particle
+                        initParticle(i);
+                    }
 
-            app.stage.addChild(particles);
+                    particle.x = H[b + X];
+                    particle.y = H[b + Y];
+                }
 
-            // Particle data
-            const particleData = [];
+"""
 
-            for (let i = 0; i < {count}; i++) {{
-                const particle = new PIXI.Particle({{
+_FOUNTAIN_WASM = dict(
+    _FOUNTAIN,
+    setup_js=_FOUNTAIN_WASM_STATE_JS + _FOUNTAIN_INIT_JS,
+    update_js=_FOUNTAIN_WASM_UPDATE_JS
+)
+
+_FIRE_SETUP_JS = """\
+            // Particle state: one typed array per field (structure of arrays)
+            const sprites = new Array(count);
+            const vx = new Float32Array(count);
+            const vy = new Float32Array(count);
+            const life = new Float32Array(count);
+            const maxLife = new Float32Array(count);
+
+            for (let i = 0; i < count; i++) {
+                const particle = new PIXI.Particle({
                     texture: particleTexture,
                     x: 400,
                     y: 550
-                }});
+                });
 
                 particles.addParticle(particle);
-
-                particleData.push({{
-                    particle,
-                    vx: (Math.random() - 0.5) * 2,
-                    vy: -(Math.random() * 3 + 2),
-                    life: Math.random(),
-                    maxLife: Math.random() * 0.5 + 0.5
-                }});
-            }}
+                sprites[i] = particle;
+
+                vx[i] = (rng() - 0.5) * 2;
+                vy[i] = -(rng() * 3 + 2);
+                life[i] = rng();
+                maxLife[i] = rng() * 0.5 + 0.5;
+            }
+
+            // Tint lookup table over t = life / maxLife in [0, 1]
+            const fireLUT = new Uint32Array(256);
+
+            for (let i = 0; i < 256; i++) {
+                const t = i / 255;
+
+                // Color gradient: yellow -> orange -> red -> black
+                let r, g, b;
+                if (t > 0.66) {
+                    // Yellow to orange
+                    const localT = (t - 0.66) / 0.34;
+                    r = 255;
+                    g = Math.floor(255 * localT);
+                    b = 0;
+                } else if (t > 0.33) {
+                    // Orange to red
+                    const localT = (t - 0.33) / 0.33;
+                    r = 255;
+                    g = Math.floor(128 * localT);
+                    b = 0;
+                } else {
+                    // Red to black
+                    r = Math.floor(255 * (t / 0.33));
+                    g = 0;
+                    b = 0;
+                }
+
+                fireLUT[i] = (r << 16) | (g << 8) | b;
+            }
+
+            // Wind gusts drawn once; each frame shifts which entry a particle reads
+            const windNoise = new Float32Array(1024);
+
+            for (let i = 0; i < 1024; i++) {
+                windNoise[i] = (rng() - 0.5) * 0.1;
+            }
+
+            let frameCtr = 0;
 
             // Update loop
-            app.ticker.add((ticker) => {{
-                particleData.forEach(data => {{
+"""
+
+_FIRE_UPDATE_JS = """\
+                frameCtr++;
+
+                for (let i = 0; i < count; i++) {
+                    const particle = sprites[i];
+
                     // Physics
-                    data.particle.x += data.vx * ticker.deltaTime;
-                    data.particle.y += data.vy * ticker.deltaTime;
+                    particle.x += vx[i] * dt;
+                    particle.y += vy[i] * dt;
 
                     // Wind
-                    data.vx += (Math.random() - 0.5) * 0.1 * ticker.deltaTime;
+                    vx[i] += windNoise[(frameCtr + i) & 1023] * dt;
 
                     // Rise
-                    data.vy -= 0.05 * ticker.deltaTime;
+                    vy[i] -= 0.05 * dt;
 
                     // Fade
-                    data.life -= 0.01 * ticker.deltaTime;
-
-                    if (data.life > 0) {{
-                        const t = data.life / data.maxLife;
-
-                        // Color gradient: yellow -> orange -> red -> black
-                        let r, g, b;
-                        if (t > 0.66) {{
-                            // Yellow to orange
-                            const localT = (t - 0.66) / 0.34;
-                            r = 255;
-                            g = Math.floor(255 * localT);
-                            b = 0;
-                        }} else if (t > 0.33) {{
-                            // Orange to red
-                            const localT = (t - 0.33) / 0.33;
-                            r = 255;
-                            g = Math.floor(128 * localT);
-                            b = 0;
-                        }} else {{
-                            // Red to black
-                            r = Math.floor(255 * (t / 0.33));
-                            g = 0;
-                            b = 0;
-                        }}
-
-                        data.particle.tint = (r << 16) | (g << 8) | b;
-                        data.particle.alpha = t;
-                        data.particle.scaleX = t * 1.5;
-                        data.particle.scaleY = t * 1.5;
-                        data.particle.rotation += 0.1 * ticker.deltaTime;
-                    }} else {{
-                        // Reset particle
-                        data.particle.x = 400 + (Math.random() - 0.5) * 100;
-                        data.particle.y = 550;
-                        data.vx = (Math.random() - 0.5) * 2;
-                        data.vy = -(Math.random() * 3 + 2);
-                        data.life = data.maxLife;
-                    }}
-                }});
-
-                document.getElementById('fps').textContent = Math.round(app.ticker.FPS);
-            }});
-        }})();
-    </script>
-</body>
-</html>"""
+                    life[i] -= 0.01 * dt;
 
+                    if (life[i] > 0) {
+                        const t = life[i] / maxLife[i];
 
-def generate_snow_particles(count: int = 3000) -> str:
-    """Generate snow particle system"""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Snow Particles</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: linear-gradient(to bottom, #2c3e50, #34495e);
-        }}
-        #info {{
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Snow Particles</h3>
-        <p>Particles: {count}</p>
-        <p>FPS: <span id="fps">--</span></p>
-    </div>
-
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {{
-            const app = new PIXI.Application();
-
-            await app.init({{
-                width: 800,
-                height: 600,
-                backgroundAlpha: 0,
-                antialias: true
-            }});
-
-            document.body.appendChild(app.canvas);
-
-            // Create snowflake texture
-            const graphics = new PIXI.Graphics();
-            graphics.circle(3, 3, 3).fill(0xffffff);
-            const snowTexture = app.renderer.generateTexture(graphics);
+                        // Initial life can exceed maxLife; clamp to the table
+                        particle.tint = fireLUT[t < 1 ? (t * 255) | 0 : 255];
+                        particle.alpha = t;
+                        particle.scaleX = t * 1.5;
+                        particle.scaleY = t * 1.5;
+                    } else {
+                        // Reset particle
+                        particle.x = 400 + (rng() - 0.5) * 100;
+                        particle.y = 550;
+                        vx[i] = (rng() - 0.5) * 2;
+                        vy[i] = -(rng() * 3 + 2);
+                        life[i] = maxLife[i];
+                    }
+                }
 
-            // Create particle container
-            const particles = new PIXI.ParticleContainer({{
-                maxSize: {count},
-                dynamicProperties: {{
-                    position: true,
-                    scale: true,
-                    rotation: true,
-                    color: false
-                }}
-            }});
+"""
 
-            app.stage.addChild(particles);
+_FIRE = {
+    'heading': 'Fire Particles',
+    'css_background': '#1a0a00',
+    'background_option': 'backgroundColor: 0x1a0a00',
+    'renderer_options': '',
+    'radius': 8,
+    'scale': 'true',
+    'rotation': 'false',
+    'color': 'true',
+    'setup_js': _FIRE_SETUP_JS,
+    'update_js': _FIRE_UPDATE_JS,
+    'after_js': ''
+}
 
-            // Particle data
-            const particleData = [];
+_SNOW_SETUP_JS = """\
+            // Particle state: one typed array per field (structure of arrays)
+            const sprites = new Array(count);
+            const speed = new Float32Array(count);
+            const sway = new Float32Array(count);
+            const swaySpeed = new Float32Array(count);
 
-            for (let i = 0; i < {count}; i++) {{
-                const particle = new PIXI.Particle({{
-                    texture: snowTexture,
-                    x: Math.random() * 800,
-                    y: Math.random() * 600,
-                    scaleX: Math.random() * 0.5 + 0.5,
-                    scaleY: Math.random() * 0.5 + 0.5,
-                    alpha: Math.random() * 0.5 + 0.5
-                }});
+            for (let i = 0; i < count; i++) {
+                sprites[i] = new PIXI.Particle({
+                    texture: particleTexture,
+                    x: rng() * 800,
+                    y: rng() * 600,
+                    scaleX: rng() * 0.5 + 0.5,
+                    scaleY: rng() * 0.5 + 0.5,
+                    alpha: rng() * 0.5 + 0.5
+                });
+
+                speed[i] = rng() * 1 + 0.5;
+                sway[i] = rng() * Math.PI * 2;
+                swaySpeed[i] = rng() * 0.02 + 0.01;
+            }
+
+            // Hand the whole set to the container at once instead of one
+            // addParticle() call per sprite; update() marks it for re-upload
+            particles.particleChildren = sprites;
+            particles.update();
+
+            // One period of sine for the sway offset; a table read per flake
+            // instead of a Math.sin call
+            const SIN_N = 4096;
+            const SIN_MASK = SIN_N - 1;
+            const SIN_SCALE = SIN_N / (Math.PI * 2);
+            const SIN_TAB = new Float32Array(SIN_N);
+
+            for (let i = 0; i < SIN_N; i++) {
+                SIN_TAB[i] = Math.sin(i / SIN_SCALE);
+            }
 
-                particles.addParticle(particle);
+            // Update loop
+"""
 
-                particleData.push({{
-                    particle,
-                    speed: Math.random() * 1 + 0.5,
-                    sway: Math.random() * Math.PI * 2,
-                    swaySpeed: Math.random() * 0.02 + 0.01
-                }});
-            }}
+_SNOW_UPDATE_JS = """\
+                for (let i = 0; i < count; i++) {
+                    const particle = sprites[i];
 
-            // Update loop
-            app.ticker.add((ticker) => {{
-                particleData.forEach(data => {{
                     // Fall down
-                    data.particle.y += data.speed * ticker.deltaTime;
+                    particle.y += speed[i] * dt;
 
                     // Sway left and right
-                    data.sway += data.swaySpeed * ticker.deltaTime;
-                    data.particle.x += Math.sin(data.sway) * 0.5 * ticker.deltaTime;
-
-                    // Rotate
-                    data.particle.rotation += 0.01 * ticker.deltaTime;
+                    sway[i] += swaySpeed[i] * dt;
+                    particle.x += SIN_TAB[(sway[i] * SIN_SCALE) & SIN_MASK] * 0.5 * dt;
 
                     // Reset if below screen
-                    if (data.particle.y > 600) {{
-                        data.particle.y = -10;
-                        data.particle.x = Math.random() * 800;
-                    }}
-                }});
-
-                document.getElementById('fps').textContent = Math.round(app.ticker.FPS);
-            }});
-        }})();
-    </script>
-</body>
-</html>"""
-
+                    if (particle.y > 600) {
+                        particle.y = -10;
+                        particle.x = rng() * 800;
+                    }
+                }
 
-def generate_explosion_particles(count: int = 1000) -> str:
-    """Generate explosion particle system"""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Explosion Particles</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #0a0a0a;
-        }}
-        #info {{
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Explosion Particles</h3>
-        <p>Click to explode</p>
-        <p>FPS: <span id="fps">--</span></p>
-    </div>
-
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {{
-            const app = new PIXI.Application();
-
-            await app.init({{
-                width: 800,
-                height: 600,
-                backgroundColor: 0x0a0a0a,
-                antialias: true
-            }});
-
-            document.body.appendChild(app.canvas);
-
-            // Create particle texture
-            const graphics = new PIXI.Graphics();
-            graphics.circle(4, 4, 4).fill(0xffffff);
-            const particleTexture = app.renderer.generateTexture(graphics);
-
-            // Create particle container
-            const particles = new PIXI.ParticleContainer({{
-                maxSize: {count},
-                dynamicProperties: {{
-                    position: true,
-                    scale: true,
-                    rotation: false,
-                    color: true
-                }}
-            }});
-
-            app.stage.addChild(particles);
+"""
 
-            // Particle pool
-            const particleData = [];
+_SNOW = {
+    'heading': 'Snow Particles',
+    'css_background': 'linear-gradient(to bottom, #2c3e50, #34495e)',
+    'background_option': 'backgroundAlpha: 0',
+    'renderer_options': '',
+    'radius': 3,
+    'scale': 'true',
+    'rotation': 'false',
+    'color': 'false',
+    'setup_js': _SNOW_SETUP_JS,
+    'update_js': _SNOW_UPDATE_JS,
+    'after_js': ''
+}
 
-            for (let i = 0; i < {count}; i++) {{
-                const particle = new PIXI.Particle({{
+_EXPLOSION_SETUP_JS = """\
+            // Particle pool: hot state interleaved as x, y, vx, vy, life (stride 5),
+            // with the packed tint in a Uint32 view over the tail of the same buffer
+            const STRIDE = 5, X = 0, Y = 1, VX = 2, VY = 3, LIFE = 4;
+            const hotBuf = new ArrayBuffer(count * (STRIDE * 4 + 4));
+            const H = new Float32Array(hotBuf, 0, count * STRIDE);
+            const T = new Uint32Array(hotBuf, count * STRIDE * 4, count);
+            const sprites = new Array(count);
+
+            // Free slots as a stack, live slots as a dense list: spawning pops,
+            // dying swap-removes, and the update loop only visits live particles
+            const freeStack = new Int32Array(count);
+            const activeList = new Int32Array(count);
+            let freeTop = count;
+            let activeCount = 0;
+
+            for (let i = 0; i < count; i++) {
+                const particle = new PIXI.Particle({
                     texture: particleTexture,
                     x: -100,
                     y: -100
-                }});
+                });
 
                 particle.alpha = 0;
                 particles.addParticle(particle);
-
-                particleData.push({{
-                    particle,
-                    vx: 0,
-                    vy: 0,
-                    life: 0,
-                    active: false
-                }});
-            }}
+                sprites[i] = particle;
+                freeStack[count - 1 - i] = i;
+            }
 
             // Explosion function
-            function explode(x, y) {{
-                let spawned = 0;
-
-                particleData.forEach(data => {{
-                    if (!data.active && spawned < 100) {{
-                        const angle = Math.random() * Math.PI * 2;
-                        const speed = Math.random() * 8 + 4;
-
-                        data.particle.x = x;
-                        data.particle.y = y;
-                        data.vx = Math.cos(angle) * speed;
-                        data.vy = Math.sin(angle) * speed;
-                        data.life = 1.0;
-                        data.active = true;
-                        data.particle.alpha = 1;
-
-                        spawned++;
-                    }}
-                }});
-            }}
+            function explode(x, y) {
+                for (let k = 0; k < 100 && freeTop > 0; k++) {
+                    const i = freeStack[--freeTop];
+                    const angle = rng() * Math.PI * 2;
+                    const speed = rng() * 8 + 4;
+
+                    const b = i * STRIDE;
+
+                    H[b + X] = x;
+                    H[b + Y] = y;
+                    H[b + VX] = Math.cos(angle) * speed;
+                    H[b + VY] = Math.sin(angle) * speed;
+                    H[b + LIFE] = 1.0;
+                    sprites[i].x = x;
+                    sprites[i].y = y;
+                    sprites[i].alpha = 1;
+
+                    activeList[activeCount++] = i;
+                }
+            }
+
+            // Tint lookup table over life in [0, 1]
+            const explosionLUT = new Uint32Array(256);
+
+            for (let i = 0; i < 256; i++) {
+                const t = i / 255;
+
+                // Color: white -> yellow -> orange -> red (each band spans 1020 = 4 * 255)
+                let tint;
+                if (t > 0.75) {
+                    tint = 0xFFFFFF;
+                } else if (t > 0.5) {
+                    tint = 0xFFFF00 | (((t - 0.5) * 1020) | 0);
+                } else if (t > 0.25) {
+                    tint = 0xFF0000 | ((((t - 0.25) * 1020) | 0) << 8);
+                } else {
+                    tint = ((t * 1020) | 0) << 16;
+                }
+
+                explosionLUT[i] = tint;
+            }
 
             // Click to explode
-            app.canvas.addEventListener('click', (e) => {{
+            app.canvas.addEventListener('click', (e) => {
                 const rect = app.canvas.getBoundingClientRect();
                 const x = e.clientX - rect.left;
                 const y = e.clientY - rect.top;
                 explode(x, y);
-            }});
+            });
 
             // Update loop
-            app.ticker.add((ticker) => {{
-                particleData.forEach(data => {{
-                    if (data.active) {{
-                        // Physics
-                        data.particle.x += data.vx * ticker.deltaTime;
-                        data.particle.y += data.vy * ticker.deltaTime;
-
-                        // Gravity
-                        data.vy += 0.2 * ticker.deltaTime;
-
-                        // Drag
-                        data.vx *= 0.98;
-                        data.vy *= 0.98;
-
-                        // Fade
-                        data.life -= 0.02 * ticker.deltaTime;
-
-                        if (data.life > 0) {{
-                            // Color: white -> yellow -> orange -> red
-                            let r, g, b;
-                            if (data.life > 0.75) {{
-                                r = 255;
-                                g = 255;
-                                b = 255;
-                            }} else if (data.life > 0.5) {{
-                                r = 255;
-                                g = 255;
-                                b = Math.floor((data.life - 0.5) * 4 * 255);
-                            }} else if (data.life > 0.25) {{
-                                r = 255;
-                                g = Math.floor((data.life - 0.25) * 4 * 255);
-                                b = 0;
-                            }} else {{
-                                r = Math.floor(data.life * 4 * 255);
-                                g = 0;
-                                b = 0;
-                            }}
-
-                            data.particle.tint = (r << 16) | (g << 8) | b;
-                            data.particle.alpha = data.life;
-                            data.particle.scaleX = data.life;
-                            data.particle.scaleY = data.life;
-                        }} else {{
-                            data.active = false;
-                            data.particle.alpha = 0;
-                        }}
-                    }}
-                }});
-
-                document.getElementById('fps').textContent = Math.round(app.ticker.FPS);
-            }});
+"""
 
-            // Initial explosion
-            explode(400, 300);
-        }})();
-    </script>
-</body>
-</html>"""
+_EXPLOSION_UPDATE_JS = """\
+                for (let a = 0; a < activeCount;) {
+                    const i = activeList[a];
+                    const b = i * STRIDE;
+                    const particle = sprites[i];
 
+                    // Physics
+                    H[b + X] += H[b + VX] * dt;
+                    H[b + Y] += H[b + VY] * dt;
+                    particle.x = H[b + X];
+                    particle.y = H[b + Y];
 
-def generate_stars_particles(count: int = 5000) -> str:
-    """Generate starfield particle system"""
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Starfield</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #000000;
-        }}
-        #info {{
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Starfield</h3>
-        <p>Stars: {count}</p>
-        <p>FPS: <span id="fps">--</span></p>
-    </div>
+                    // Gravity
+                    H[b + VY] += 0.2 * dt;
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {{
-            const app = new PIXI.Application();
+                    // Drag
+                    H[b + VX] *= 0.98;
+                    H[b + VY] *= 0.98;
 
-            await app.init({{
-                width: 800,
-                height: 600,
-                backgroundColor: 0x000000,
-                antialias: true
-            }});
+                    // Fade
+                    H[b + LIFE] -= 0.02 * dt;
+                    const life = H[b + LIFE];
+
+                    if (life > 0) {
+                        T[i] = explosionLUT[(life * 255) | 0];
+                        particle.tint = T[i];
+                        particle.alpha = life;
+                        particle.scaleX = life;
+                        particle.scaleY = life;
+                        a++;
+                    } else {
+                        // Swap-remove from the live list and return the slot
+                        particle.alpha = 0;
+                        activeList[a] = activeList[--activeCount];
+                        freeStack[freeTop++] = i;
+                    }
+                }
 
-            document.body.appendChild(app.canvas);
+"""
 
-            // Create star texture
-            const graphics = new PIXI.Graphics();
-            graphics.circle(2, 2, 2).fill(0xffffff);
-            const starTexture = app.renderer.generateTexture(graphics);
+_EXPLOSION_AFTER_JS = """
+            // Initial explosion
+            explode(400, 300);
+"""
 
-            // Create particle container
-            const particles = new PIXI.ParticleContainer({{
-                maxSize: {count},
-                dynamicProperties: {{
-                    position: true,
-                    scale: true,
-                    rotation: false,
-                    color: false
-                }}
-            }});
+_EXPLOSION = {
+    'heading': 'Explosion Particles',
+    'css_background': '#0a0a0a',
+    'background_option': 'backgroundColor: 0x0a0a0a',
+    'renderer_options': '',
+    'radius': 4,
+    'scale': 'true',
+    'rotation': 'false',
+    'color': 'true',
+    'setup_js': _EXPLOSION_SETUP_JS,
+    'update_js': _EXPLOSION_UPDATE_JS,
+    'after_js': _EXPLOSION_AFTER_JS
+}
 
-            app.stage.addChild(particles);
+_STARS_SETUP_JS = """\
+            // Particle state: one typed array per field (structure of arrays)
+            const sprites = new Array(count);
+            const z = new Float32Array(count);
+            const speed = new Float32Array(count);
 
-            // Particle data
-            const particleData = [];
+            // Screen positions live in typed arrays; sprites only receive output
+            const px = new Float32Array(count);
+            const py = new Float32Array(count);
 
-            for (let i = 0; i < {count}; i++) {{
-                const particle = new PIXI.Particle({{
-                    texture: starTexture,
-                    x: Math.random() * 800,
-                    y: Math.random() * 600,
-                    scaleX: Math.random(),
-                    scaleY: Math.random(),
-                    alpha: Math.random()
-                }});
+            for (let i = 0; i < count; i++) {
+                px[i] = rng() * 800;
+                py[i] = rng() * 600;
+                sprites[i] = new PIXI.Particle({
+                    texture: particleTexture,
+                    x: px[i],
+                    y: py[i],
+                    scaleX: rng(),
+                    scaleY: rng(),
+                    alpha: rng()
+                });
 
-                particles.addParticle(particle);
+                z[i] = rng() * 1000;
+                speed[i] = rng() * 2 + 1;
+            }
+
+            // All stars join the container in one assignment, as with snow
+            particles.particleChildren = sprites;
+            particles.update();
+
+            // Perspective scale 1000 / z for each whole z in [0, 1000]
+            const INV_Z = new Float32Array(1001);
+            INV_Z[0] = 1000;
 
-                particleData.push({{
-                    particle,
-                    z: Math.random() * 1000,
-                    speed: Math.random() * 2 + 1
-                }});
-            }}
+            for (let i = 1; i <= 1000; i++) {
+                INV_Z[i] = 1000 / i;
+            }
 
             // Update loop
             const centerX = 400;
             const centerY = 300;
 
-            app.ticker.add((ticker) => {{
-                particleData.forEach(data => {{
+"""
+
+_STARS_UPDATE_JS = """\
+                for (let i = 0; i < count; i++) {
+                    const particle = sprites[i];
+
                     // Move toward camera
-                    data.z -= data.speed * ticker.deltaTime;
+                    z[i] -= speed[i] * dt;
 
-                    if (data.z <= 0) {{
-                        data.z = 1000;
-                    }}
+                    if (z[i] <= 0) {
+                        z[i] = 1000;
+                    }
 
                     // Project 3D to 2D
-                    const scale = 1000 / data.z;
-                    const x = (data.particle.x - centerX) * scale + centerX;
-                    const y = (data.particle.y - centerY) * scale + centerY;
-
-                    data.particle.x = x;
-                    data.particle.y = y;
-                    data.particle.scaleX = scale;
-                    data.particle.scaleY = scale;
-                    data.particle.alpha = Math.min(scale, 1);
+                    const scale = INV_Z[z[i] | 0];
+                    let x = (px[i] - centerX) * scale + centerX;
+                    let y = (py[i] - centerY) * scale + centerY;
 
                     // Reset if off screen
-                    if (x < 0 || x > 800 || y < 0 || y > 600) {{
-                        data.particle.x = Math.random() * 800;
-                        data.particle.y = Math.random() * 600;
-                        data.z = 1000;
-                    }}
-                }});
-
-                document.getElementById('fps').textContent = Math.round(app.ticker.FPS);
-            }});
-        }})();
-    </script>
-</body>
-</html>"""
+                    if (x < 0 || x > 800 || y < 0 || y > 600) {
+                        x = rng() * 800;
+                        y = rng() * 600;
+                        z[i] = 1000;
+                    }
+
+                    px[i] = x;
+                    py[i] = y;
+                    particle.x = x;
+                    particle.y = y;
+                    particle.scaleX = scale;
+                    particle.scaleY = scale;
+                    particle.alpha = Math.min(scale, 1);
+                }
+
+"""
+
+_STARS = {
+    'heading': 'Starfield',
+    'css_background': '#000000',
+    'background_option': 'backgroundColor: 0x000000',
+    'renderer_options': _WEBGPU_PREFERENCE,
+    'radius': 2,
+    'scale': 'true',
+    'rotation': 'false',
+    'color': 'false',
+    'setup_js': _STARS_SETUP_JS,
+    'update_js': _STARS_UPDATE_JS,
+    'after_js': ''
+}
+
+
+# Stands in for the particle count while the shell is pre-rendered
+_COUNT_MARK = '\0'
+
+
+def _page_parts(effect: Dict, info: str) -> Tuple[str, ...]:
+    """Pre-render the shell for one effect, split wherever the count goes"""
+    return tuple(_SHELL.format_map(dict(effect, count=_COUNT_MARK, info=info)).split(_COUNT_MARK))
+
+
+# Every field except the count is resolved once at import
+_FOUNTAIN_PARTS = _page_parts(_FOUNTAIN, 'Particles: ' + _COUNT_MARK)
+_FOUNTAIN_WASM_PARTS = _page_parts(_FOUNTAIN_WASM, 'Particles: ' + _COUNT_MARK)
+_FIRE_PARTS = _page_parts(_FIRE, 'Particles: ' + _COUNT_MARK)
+_SNOW_PARTS = _page_parts(_SNOW, 'Particles: ' + _COUNT_MARK)
+_EXPLOSION_PARTS = _page_parts(_EXPLOSION, 'Click to explode')
+_STARS_PARTS = _page_parts(_STARS, 'Stars: ' + _COUNT_MARK)
+
+
+@lru_cache(maxsize=32)
+def generate_fountain_particles(count: int = 5000) -> str:
+    """Generate fountain particle system"""
+    return str(count).join(_FOUNTAIN_PARTS)
+
+
+@lru_cache(maxsize=32)
+def generate_fountain_particles_wasm(count: int = 5000) -> str:
+    """Generate fountain particle system with WebAssembly physics"""
+    return str(count).join(_FOUNTAIN_WASM_PARTS)
+
+
+@lru_cache(maxsize=32)
+def generate_fire_particles(count: int = 2000) -> str:
+    """Generate fire particle system"""
+    return str(count).join(_FIRE_PARTS)
+
+
+@lru_cache(maxsize=32)
+def generate_snow_particles(count: int = 3000) -> str:
+    """Generate snow particle system"""
+    return str(count).join(_SNOW_PARTS)
+
+
+@lru_cache(maxsize=32)
+def generate_explosion_particles(count: int = 1000) -> str:
+    """Generate explosion particle system"""
+    return str(count).join(_EXPLOSION_PARTS)
+
+
+@lru_cache(maxsize=32)
+def generate_stars_particles(count: int = 5000) -> str:
+    """Generate starfield particle system"""
+    return str(count).join(_STARS_PARTS)
 
 
 # Particle type registry
@@ -719,7 +770,8 @@ PARTICLE_TYPES: Dict[str, Dict] = {
         'name': 'Fountain',
         'description': 'Particles shooting upward with gravity',
         'default_count': 5000,
-        'generator': generate_fountain_particles
+        'generator': generate_fountain_particles,
+        'wasm_generator': generate_fountain_particles_wasm
     },
     'fire': {
         'name': 'Fire',
@@ -748,6 +800,18 @@ PARTICLE_TYPES: Dict[str, Dict] = {
 }
 
 
+def _write_html(path: str, html: str) -> None:
+    """Write the page as UTF-8 bytes with raw os-level calls, bypassing buffered text IO"""
+    data = memoryview(html.encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def interactive_mode():
     """Run interactive particle builder"""
     print("\n" + "="*60)
@@ -797,8 +861,7 @@ def interactive_mode():
         filename = f"{particle_type}_particles.html"
         html_path = os.path.join(output_dir, filename)
 
-        with open(html_path, 'w') as f:
-            f.write(html)
+        _write_html(html_path, html)
 
         print(f"\n✓ Particle system created: {html_path}")
         print(f"\nParticle type: {PARTICLE_TYPES[particle_type]['name']}")
@@ -821,6 +884,7 @@ def cli_mode(args):
     particle_type = args.type
     count = args.count
     output_dir = args.output
+    backend = args.backend
 
     # Validate particle type
     if particle_type not in PARTICLE_TYPES:
@@ -832,9 +896,15 @@ def cli_mode(args):
     if count is None:
         count = PARTICLE_TYPES[particle_type]['default_count']
 
+    # Validate backend
+    generator_key = 'wasm_generator' if backend == 'wasm' else 'generator'
+    if generator_key not in PARTICLE_TYPES[particle_type]:
+        print(f"Error: Backend '{backend}' is not available for '{particle_type}' particles")
+        return 1
+
     # Generate particles
     try:
-        generator = PARTICLE_TYPES[particle_type]['generator']
+        generator = PARTICLE_TYPES[particle_type][generator_key]
         html = generator(count)
 
         # Create output directory
@@ -844,8 +914,7 @@ def cli_mode(args):
         filename = f"{particle_type}_particles.html"
         html_path = os.path.join(output_dir, filename)
 
-        with open(html_path, 'w') as f:
-            f.write(html)
+        _write_html(html_path, html)
 
         print(f"✓ Particle system created: {html_path}")
         return 0
@@ -873,6 +942,9 @@ Examples:
   Generate snow particles:
     python particle_builder.py -t snow -c 3000
 
+  Generate fountain particles with WebAssembly physics:
+    python particle_builder.py -t fountain --backend wasm
+
 Available particle types:
   fountain   - Particles shooting upward with gravity
   fire       - Fire effect with color gradient
@@ -900,6 +972,13 @@ Available particle types:
         help='Output directory (default: current directory)'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=['js', 'wasm'],
+        default='js',
+        help='Physics backend (default: js; wasm is available for fountain)'
+    )
+
     args = parser.parse_args()
 
     # Run interactive mode if no particle type specified
@@ -13,28 +13,30 @@ Usage:
         python sprite_generator.py -t animated --name MySprite
 """
 
-import argparse
-import os
 import sys
-from typing import Dict, Tuple
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
 
 
-def generate_basic_sprite() -> Tuple[str, str]:
-    """Generate basic sprite example"""
-    html = """<!DOCTYPE html>
+# Page skeleton shared by every sprite type; each page below fills in its
+# title, colors, info panel and script. %-style fields keep the CSS and JS
+# braces literal.
+_SKELETON = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Basic Sprite</title>
+    <title>PixiJS %(title)s</title>
     <style>
         body {
             margin: 0;
             padding: 0;
             overflow: hidden;
-            background: #1a1a2e;
+            background: #%(background)s;
         }
-        #info {
+        #%(panel_id)s {
             position: absolute;
             top: 10px;
             left: 10px;
@@ -44,29 +46,36 @@ def generate_basic_sprite() -> Tuple[str, str]:
             padding: 10px;
             border-radius: 5px;
         }
-    </style>
+%(extra_css)s    </style>
 </head>
 <body>
-    <div id="info">
-        <h3>Basic Sprite</h3>
-        <p>Click the sprite to change color</p>
-    </div>
+    <div id="%(panel_id)s">
+        <h3>%(heading)s</h3>
+%(panel)s    </div>
 
     <script src="https://pixijs.download/release/pixi.js"></script>
     <script>
         (async () => {
-            // Create application
             const app = new PIXI.Application();
 
             await app.init({
                 width: 800,
                 height: 600,
-                backgroundColor: 0x1a1a2e,
+                backgroundColor: 0x%(background)s,
                 antialias: true
             });
 
             document.body.appendChild(app.canvas);
 
+%(script)s        })();
+    </script>
+</body>
+</html>"""
+
+# Sprite fill colors shared by the interactive and atlas pages
+_PALETTE_JS = '[0xe74c3c, 0x3498db, 0x2ecc71, 0xf39c12, 0x9b59b6]'
+
+_BASIC_SCRIPT = """\
             // Create sprite
             const graphics = new PIXI.Graphics();
             graphics.rect(0, 0, 100, 100).fill(0x3498db);
@@ -97,109 +106,25 @@ def generate_basic_sprite() -> Tuple[str, str]:
                 newGraphics.rect(0, 0, 100, 100).fill(colors[colorIndex]);
                 sprite.texture = app.renderer.generateTexture(newGraphics);
             });
-        })();
-    </script>
-</body>
-</html>"""
-
-    js = """// Standalone JavaScript version
-import { Application, Sprite, Graphics } from 'pixi.js';
-
-(async () => {
-    const app = new Application();
-
-    await app.init({
-        width: 800,
-        height: 600,
-        backgroundColor: 0x1a1a2e,
-        antialias: true
-    });
-
-    document.body.appendChild(app.canvas);
-
-    // Create sprite
-    const graphics = new Graphics();
-    graphics.rect(0, 0, 100, 100).fill(0x3498db);
-
-    const texture = app.renderer.generateTexture(graphics);
-    const sprite = new Sprite(texture);
-
-    sprite.anchor.set(0.5);
-    sprite.position.set(400, 300);
-    sprite.eventMode = 'static';
-    sprite.cursor = 'pointer';
-
-    app.stage.addChild(sprite);
-
-    // Rotate animation
-    app.ticker.add((ticker) => {
-        sprite.rotation += 0.01 * ticker.deltaTime;
-    });
-
-    // Click event
-    const colors = [0x3498db, 0xe74c3c, 0x2ecc71, 0xf39c12, 0x9b59b6];
-    let colorIndex = 0;
-
-    sprite.on('pointerdown', () => {
-        colorIndex = (colorIndex + 1) % colors.length;
-
-        const newGraphics = new Graphics();
-        newGraphics.rect(0, 0, 100, 100).fill(colors[colorIndex]);
-        sprite.texture = app.renderer.generateTexture(newGraphics);
-    });
-})();
 """
 
-    return html, js
-
-
-def generate_interactive_sprite() -> Tuple[str, str]:
-    """Generate interactive sprite with drag and hover"""
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Interactive Sprite</title>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #0f0f23;
-        }
-        #info {
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Interactive Sprite</h3>
-        <p>Drag to move • Hover to scale</p>
-    </div>
+_BASIC_HTML = _SKELETON % {
+    'title': 'Basic Sprite',
+    'heading': 'Basic Sprite',
+    'background': '1a1a2e',
+    'panel_id': 'info',
+    'extra_css': '',
+    'panel': '        <p>Click the sprite to change color</p>\n',
+    'script': _BASIC_SCRIPT
+}
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {
-            const app = new PIXI.Application();
 
-            await app.init({
-                width: 800,
-                height: 600,
-                backgroundColor: 0x0f0f23,
-                antialias: true
-            });
+def generate_basic_sprite() -> str:
+    """Generate basic sprite example"""
+    return _BASIC_HTML
 
-            document.body.appendChild(app.canvas);
 
+_INTERACTIVE_SCRIPT = """\
             // Create draggable sprite
             function createDraggableSprite(x, y, color) {
                 const graphics = new PIXI.Graphics();
@@ -263,7 +188,7 @@ def generate_interactive_sprite() -> Tuple[str, str]:
             }
 
             // Create multiple draggable sprites
-            const colors = [0xe74c3c, 0x3498db, 0x2ecc71, 0xf39c12, 0x9b59b6];
+            const colors = """ + _PALETTE_JS + """;
 
             for (let i = 0; i < 5; i++) {
                 const x = 150 + i * 120;
@@ -271,70 +196,25 @@ def generate_interactive_sprite() -> Tuple[str, str]:
                 const sprite = createDraggableSprite(x, y, colors[i]);
                 app.stage.addChild(sprite);
             }
-        })();
-    </script>
-</body>
-</html>"""
-
-    js = ""  # Standalone JS same as embedded
-    return html, js
-
+"""
 
-def generate_animated_sprite() -> Tuple[str, str]:
-    """Generate sprite sheet animation"""
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Animated Sprite</title>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #2c3e50;
-        }
-        #controls {
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }
-        button {
-            margin: 5px;
-            padding: 5px 10px;
-            cursor: pointer;
-        }
-    </style>
-</head>
-<body>
-    <div id="controls">
-        <h3>Animated Sprite</h3>
-        <button id="play">Play</button>
-        <button id="stop">Stop</button>
-        <button id="faster">Faster</button>
-        <button id="slower">Slower</button>
-    </div>
+_INTERACTIVE_HTML = _SKELETON % {
+    'title': 'Interactive Sprite',
+    'heading': 'Interactive Sprite',
+    'background': '0f0f23',
+    'panel_id': 'info',
+    'extra_css': '',
+    'panel': '        <p>Drag to move • Hover to scale</p>\n',
+    'script': _INTERACTIVE_SCRIPT
+}
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {
-            const app = new PIXI.Application();
 
-            await app.init({
-                width: 800,
-                height: 600,
-                backgroundColor: 0x2c3e50,
-                antialias: true
-            });
+def generate_interactive_sprite() -> str:
+    """Generate interactive sprite with drag and hover"""
+    return _INTERACTIVE_HTML
 
-            document.body.appendChild(app.canvas);
 
+_ANIMATED_SCRIPT = """\
             // Generate sprite sheet frames
             const frames = [];
             for (let i = 0; i < 12; i++) {
@@ -380,62 +260,40 @@ def generate_animated_sprite() -> Tuple[str, str]:
             app.ticker.add((ticker) => {
                 animation.rotation += 0.01 * ticker.deltaTime;
             });
-        })();
-    </script>
-</body>
-</html>"""
+"""
 
-    js = ""
-    return html, js
+_ANIMATED_CSS = """\
+        button {
+            margin: 5px;
+            padding: 5px 10px;
+            cursor: pointer;
+        }
+"""
 
+_ANIMATED_PANEL = """\
+        <button id="play">Play</button>
+        <button id="stop">Stop</button>
+        <button id="faster">Faster</button>
+        <button id="slower">Slower</button>
+"""
 
-def generate_tiled_sprites() -> Tuple[str, str]:
-    """Generate tiled sprite pattern"""
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Tiled Sprites</title>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #34495e;
-        }
-        #info {
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Tiled Sprites</h3>
-        <p>Scrolling background pattern</p>
-    </div>
+_ANIMATED_HTML = _SKELETON % {
+    'title': 'Animated Sprite',
+    'heading': 'Animated Sprite',
+    'background': '2c3e50',
+    'panel_id': 'controls',
+    'extra_css': _ANIMATED_CSS,
+    'panel': _ANIMATED_PANEL,
+    'script': _ANIMATED_SCRIPT
+}
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {
-            const app = new PIXI.Application();
 
-            await app.init({
-                width: 800,
-                height: 600,
-                backgroundColor: 0x34495e,
-                antialias: true
-            });
+def generate_animated_sprite() -> str:
+    """Generate sprite sheet animation"""
+    return _ANIMATED_HTML
 
-            document.body.appendChild(app.canvas);
 
+_TILED_SCRIPT = """\
             // Create tile texture
             const graphics = new PIXI.Graphics();
             graphics.rect(0, 0, 64, 64).fill(0x3498db);
@@ -457,66 +315,29 @@ def generate_tiled_sprites() -> Tuple[str, str]:
                 tilingSprite.tilePosition.x += 1 * ticker.deltaTime;
                 tilingSprite.tilePosition.y += 0.5 * ticker.deltaTime;
             });
-        })();
-    </script>
-</body>
-</html>"""
-
-    js = ""
-    return html, js
-
+"""
 
-def generate_spritesheet_atlas() -> Tuple[str, str]:
-    """Generate sprite sheet with texture atlas"""
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Sprite Sheet</title>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #1a1a2e;
-        }
-        #info {
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Sprite Sheet Atlas</h3>
-        <p>Multiple sprites from texture atlas</p>
-    </div>
+_TILED_HTML = _SKELETON % {
+    'title': 'Tiled Sprites',
+    'heading': 'Tiled Sprites',
+    'background': '34495e',
+    'panel_id': 'info',
+    'extra_css': '',
+    'panel': '        <p>Scrolling background pattern</p>\n',
+    'script': _TILED_SCRIPT
+}
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {
-            const app = new PIXI.Application();
 
-            await app.init({
-                width: 800,
-                height: 600,
-                backgroundColor: 0x1a1a2e,
-                antialias: true
-            });
+def generate_tiled_sprites() -> str:
+    """Generate tiled sprite pattern"""
+    return _TILED_HTML
 
-            document.body.appendChild(app.canvas);
 
+_ATLAS_SCRIPT = """\
             // Create texture atlas (sprite sheet)
             const atlas = {};
             const shapes = ['circle', 'square', 'triangle', 'star', 'hexagon'];
-            const colors = [0xe74c3c, 0x3498db, 0x2ecc71, 0xf39c12, 0x9b59b6];
+            const colors = """ + _PALETTE_JS + """;
 
             shapes.forEach((shape, index) => {
                 const graphics = new PIXI.Graphics();
@@ -574,62 +395,25 @@ def generate_spritesheet_atlas() -> Tuple[str, str]:
                     sprite.y = startY + Math.sin(Date.now() * 0.001 + index) * 20;
                 });
             });
-        })();
-    </script>
-</body>
-</html>"""
-
-    js = ""
-    return html, js
-
+"""
 
-def generate_masked_sprite() -> Tuple[str, str]:
-    """Generate sprite with mask"""
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PixiJS Masked Sprite</title>
-    <style>
-        body {
-            margin: 0;
-            padding: 0;
-            overflow: hidden;
-            background: #2c3e50;
-        }
-        #info {
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            color: white;
-            font-family: monospace;
-            background: rgba(0, 0, 0, 0.7);
-            padding: 10px;
-            border-radius: 5px;
-        }
-    </style>
-</head>
-<body>
-    <div id="info">
-        <h3>Masked Sprite</h3>
-        <p>Circular mask reveals gradient</p>
-    </div>
+_ATLAS_HTML = _SKELETON % {
+    'title': 'Sprite Sheet',
+    'heading': 'Sprite Sheet Atlas',
+    'background': '1a1a2e',
+    'panel_id': 'info',
+    'extra_css': '',
+    'panel': '        <p>Multiple sprites from texture atlas</p>\n',
+    'script': _ATLAS_SCRIPT
+}
 
-    <script src="https://pixijs.download/release/pixi.js"></script>
-    <script>
-        (async () => {
-            const app = new PIXI.Application();
 
-            await app.init({
-                width: 800,
-                height: 600,
-                backgroundColor: 0x2c3e50,
-                antialias: true
-            });
+def generate_spritesheet_atlas() -> str:
+    """Generate sprite sheet with texture atlas"""
+    return _ATLAS_HTML
 
-            document.body.appendChild(app.canvas);
 
+_MASKED_SCRIPT = """\
             // Create gradient texture
             const canvas = document.createElement('canvas');
             canvas.width = 400;
@@ -676,13 +460,22 @@ def generate_masked_sprite() -> Tuple[str, str]:
                 mask.clear();
                 mask.circle(400, 300, radius).fill(0xffffff);
             });
-        })();
-    </script>
-</body>
-</html>"""
+"""
+
+_MASKED_HTML = _SKELETON % {
+    'title': 'Masked Sprite',
+    'heading': 'Masked Sprite',
+    'background': '2c3e50',
+    'panel_id': 'info',
+    'extra_css': '',
+    'panel': '        <p>Circular mask reveals gradient</p>\n',
+    'script': _MASKED_SCRIPT
+}
 
-    js = ""
-    return html, js
+
+def generate_masked_sprite() -> str:
+    """Generate sprite with mask"""
+    return _MASKED_HTML
 
 
 # Sprite type registry
@@ -690,57 +483,72 @@ SPRITE_TYPES: Dict[str, Dict] = {
     'basic': {
         'name': 'Basic Sprite',
         'description': 'Simple rotating sprite with color change on click',
-        'generator': generate_basic_sprite
+        'html': _BASIC_HTML
     },
     'interactive': {
         'name': 'Interactive Sprite',
         'description': 'Draggable sprites with hover effects',
-        'generator': generate_interactive_sprite
+        'html': _INTERACTIVE_HTML
     },
     'animated': {
         'name': 'Animated Sprite',
         'description': 'Sprite sheet animation with playback controls',
-        'generator': generate_animated_sprite
+        'html': _ANIMATED_HTML
     },
     'tiled': {
         'name': 'Tiled Sprite',
         'description': 'Scrolling background with tiling sprite',
-        'generator': generate_tiled_sprites
+        'html': _TILED_HTML
     },
     'atlas': {
         'name': 'Sprite Sheet Atlas',
         'description': 'Multiple sprites from texture atlas',
-        'generator': generate_spritesheet_atlas
+        'html': _ATLAS_HTML
     },
     'masked': {
         'name': 'Masked Sprite',
         'description': 'Sprite with animated circular mask',
-        'generator': generate_masked_sprite
+        'html': _MASKED_HTML
     }
 }
 
+# Registry keys in menu order, and how many there are
+_SPRITE_KEYS = tuple(SPRITE_TYPES)
+_NUM_TYPES = len(_SPRITE_KEYS)
+
+_RULE = "=" * 60
+_DIVIDER = "-" * 60
+
+# Banner and type menu, written as one block when interactive mode starts
+_MENU = (
+    f"\n{_RULE}\nPixiJS Sprite Generator - Interactive Mode\n{_RULE}\n"
+    f"\nAvailable sprite types:\n{_DIVIDER}\n"
+    + "".join(
+        f"{idx}. {info['name']:25} - {info['description']}\n"
+        for idx, info in enumerate(SPRITE_TYPES.values(), 1)
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _page_bytes(sprite_type: str) -> bytes:
+    """UTF-8 encoding of a sprite type's page, encoded once per type"""
+    return SPRITE_TYPES[sprite_type]['html'].encode('utf-8')
+
 
 def interactive_mode():
     """Run interactive sprite generator"""
-    print("\n" + "="*60)
-    print("PixiJS Sprite Generator - Interactive Mode")
-    print("="*60)
-
-    # Show sprite types
-    print("\nAvailable sprite types:")
-    print("-" * 60)
-    for idx, (key, info) in enumerate(SPRITE_TYPES.items(), 1):
-        print(f"{idx}. {info['name']:25} - {info['description']}")
+    sys.stdout.write(_MENU)
 
     # Get sprite type
     while True:
         try:
-            choice = input(f"\nSelect sprite type (1-{len(SPRITE_TYPES)}): ").strip()
+            choice = input(f"\nSelect sprite type (1-{_NUM_TYPES}): ").strip()
             idx = int(choice)
-            if 1 <= idx <= len(SPRITE_TYPES):
-                sprite_type = list(SPRITE_TYPES.keys())[idx - 1]
+            if 1 <= idx <= _NUM_TYPES:
+                sprite_type = _SPRITE_KEYS[idx - 1]
                 break
-            print(f"Error: Please enter a number between 1 and {len(SPRITE_TYPES)}")
+            print(f"Error: Please enter a number between 1 and {_NUM_TYPES}")
         except ValueError:
             print("Error: Please enter a valid number")
 
@@ -758,28 +566,30 @@ def interactive_mode():
         filename += '.html'
 
     # Generate sprite
-    print("\n" + "-"*60)
-    print("Generating sprite...")
+    sys.stdout.write(f"\n{_DIVIDER}\nGenerating sprite...\n")
 
     try:
-        generator = SPRITE_TYPES[sprite_type]['generator']
-        html, js = generator()
+        html = SPRITE_TYPES[sprite_type]['html']
 
         # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
 
         # Write HTML file
-        html_path = os.path.join(output_dir, filename)
-        with open(html_path, 'w') as f:
-            f.write(html)
+        html_path = out / filename
+        html_path.write_bytes(_page_bytes(sprite_type))
 
-        print(f"\n✓ Sprite created: {html_path}")
-        print(f"\nSprite type: {SPRITE_TYPES[sprite_type]['name']}")
-        print(f"Lines of code: {len(html.splitlines())}")
+        # Pages never end in a newline, so lines = newlines + 1
+        line_count = html.count('\n') + 1
 
-        print("\nTo view:")
-        print(f"  Open {html_path} in a web browser")
-        print(f"  Or run: python -m http.server 8000")
+        sys.stdout.write(
+            f"\n✓ Sprite created: {html_path}\n"
+            f"\nSprite type: {SPRITE_TYPES[sprite_type]['name']}\n"
+            f"Lines of code: {line_count}\n"
+            "\nTo view:\n"
+            f"  Open {html_path} in a web browser\n"
+            "  Or run: python -m http.server 8000\n"
+        )
 
     except Exception as e:
         print(f"\nError: Failed to generate sprite: {e}")
@@ -797,23 +607,18 @@ def cli_mode(args):
     # Validate sprite type
     if sprite_type not in SPRITE_TYPES:
         print(f"Error: Unknown sprite type '{sprite_type}'")
-        print(f"Available types: {', '.join(SPRITE_TYPES.keys())}")
+        print(f"Available types: {', '.join(_SPRITE_KEYS)}")
         return 1
 
     # Generate sprite
     try:
-        generator = SPRITE_TYPES[sprite_type]['generator']
-        html, js = generator()
-
         # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
 
         # Write HTML file
-        filename = f"{name}.html"
-        html_path = os.path.join(output_dir, filename)
-
-        with open(html_path, 'w') as f:
-            f.write(html)
+        html_path = out / f"{name}.html"
+        html_path.write_bytes(_page_bytes(sprite_type))
 
         print(f"✓ Sprite created: {html_path}")
         return 0
@@ -823,7 +628,45 @@ def cli_mode(args):
         return 1
 
 
-def main():
+# Option spellings understood by the fast command-line path
+_OPTION_DESTS = {
+    '-t': 'type', '--type': 'type',
+    '-o': 'output', '--output': 'output',
+    '-n': 'name', '--name': 'name'
+}
+
+
+def _parse_fast(argv):
+    """Parse plain '-t basic' / '--type=basic' style command lines directly.
+
+    Returns None for anything else (help, unknown or abbreviated options,
+    missing values, invalid types) so argparse can handle it.
+    """
+    values = {'type': None, 'output': '.', 'name': None}
+    args = iter(argv)
+
+    for arg in args:
+        option, has_value, value = arg.partition('=')
+        dest = _OPTION_DESTS.get(option)
+        if dest is None or (has_value and not option.startswith('--')):
+            return None
+        if not has_value:
+            value = next(args, None)
+            if value is None or value.startswith('-'):
+                return None
+        values[dest] = value
+
+    if values['type'] is not None and values['type'] not in SPRITE_TYPES:
+        return None
+
+    return SimpleNamespace(**values)
+
+
+def _build_parser():
+    """Full argparse parser, used for help and error reporting"""
+    # Imported here so the fast path and library use skip argparse
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='PixiJS Sprite Generator',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -853,7 +696,7 @@ Available sprite types:
 
     parser.add_argument(
         '-t', '--type',
-        choices=list(SPRITE_TYPES.keys()),
+        choices=_SPRITE_KEYS,
         help='Sprite type'
     )
 
@@ -868,7 +711,12 @@ Available sprite types:
         help='Output filename (default: sprite)'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+    args = _parse_fast(argv) or _build_parser().parse_args(argv)
 
     # Run interactive mode if no sprite type specified
     if not args.type:
@@ -20,44 +20,45 @@ Options:
 
 import os
 import sys
-import argparse
-import subprocess
-from pathlib import Path
+from functools import lru_cache
+from typing import Optional
 
 
-def create_package_json(project_name: str) -> str:
-    """Generate package.json content."""
-    return f'''{{
-  "name": "{project_name}",
+_PACKAGE_JSON_TEMPLATE = '''{
+  "name": "__NAME__",
   "version": "1.0.0",
   "description": "Barba.js page transition project",
   "main": "src/main.js",
-  "scripts": {{
+  "scripts": {
     "dev": "vite",
     "build": "vite build",
     "preview": "vite preview"
-  }},
+  },
   "keywords": ["barba", "page-transitions", "gsap"],
   "author": "",
   "license": "MIT",
-  "devDependencies": {{
+  "devDependencies": {
     "@barba/core": "^2.9.7",
     "gsap": "^3.12.5",
     "vite": "^5.0.0"
-  }}
-}}
+  }
+}
 '''
 
 
-def create_index_html(minimal: bool = False) -> str:
-    """Generate index.html content."""
-    return '''<!DOCTYPE html>
+def create_package_json(project_name: str) -> str:
+    """Generate package.json content."""
+    return _PACKAGE_JSON_TEMPLATE.replace('__NAME__', project_name)
+
+
+# Markup shared by every page; __TITLE__ is replaced per page
+_PAGE_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Home - Barba.js Project</title>
-  <meta name="description" content="Home page with Barba.js transitions">
+  <title>__TITLE__ - Barba.js Project</title>
+  <meta name="description" content="__TITLE__ page with Barba.js transitions">
   <link rel="stylesheet" href="/src/style.css">
 </head>
 <body data-barba="wrapper">
@@ -72,7 +73,28 @@ def create_index_html(minimal: bool = False) -> str:
     </nav>
   </header>
 
-  <main data-barba="container" data-barba-namespace="home">
+'''
+
+_PAGE_TAIL = '''
+  <footer class="site-footer">
+    <p>&copy; 2025 Barba.js Project</p>
+  </footer>
+
+  <div class="page-loader">Loading...</div>
+  <div class="transition-curtain"></div>
+
+  <script type="module" src="/src/main.js"></script>
+</body>
+</html>
+'''
+
+
+def _html_page(title: str, main: str) -> str:
+    """Wrap a page's <main> block in the shared head, navigation and footer."""
+    return _PAGE_HEAD.replace('__TITLE__', title) + main + _PAGE_TAIL
+
+
+_INDEX_HTML = _html_page('Home', '''  <main data-barba="container" data-barba-namespace="home">
     <div class="hero">
       <h1 class="stagger-item">Welcome to Barba.js</h1>
       <p class="stagger-item">Smooth page transitions without full page reloads</p>
@@ -94,44 +116,16 @@ def create_index_html(minimal: bool = False) -> str:
       </div>
     </section>
   </main>
+''')
+_INDEX_HTML_BYTES = _INDEX_HTML.encode('utf-8')
 
-  <footer class="site-footer">
-    <p>&copy; 2025 Barba.js Project</p>
-  </footer>
 
-  <div class="page-loader">Loading...</div>
-  <div class="transition-curtain"></div>
-
-  <script type="module" src="/src/main.js"></script>
-</body>
-</html>
-'''
+def create_index_html(minimal: bool = False) -> str:
+    """Generate index.html content."""
+    return _INDEX_HTML
 
 
-def create_about_html() -> str:
-    """Generate about.html content."""
-    return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>About - Barba.js Project</title>
-  <meta name="description" content="About page with Barba.js transitions">
-  <link rel="stylesheet" href="/src/style.css">
-</head>
-<body data-barba="wrapper">
-  <header class="site-header">
-    <nav>
-      <a href="/" class="logo">Barba.js</a>
-      <ul>
-        <li><a href="/">Home</a></li>
-        <li><a href="/about.html">About</a></li>
-        <li><a href="/contact.html">Contact</a></li>
-      </ul>
-    </nav>
-  </header>
-
-  <main data-barba="container" data-barba-namespace="about">
+_ABOUT_HTML = _html_page('About', '''  <main data-barba="container" data-barba-namespace="about">
     <div class="content-page">
       <h1 class="stagger-item">About Barba.js</h1>
       <p class="stagger-item">Barba.js is a small (7kb minified and compressed) library that helps you create fluid and smooth transitions between your website's pages.</p>
@@ -139,44 +133,16 @@ def create_about_html() -> str:
       <a href="/contact.html" class="btn stagger-item">Get in Touch</a>
     </div>
   </main>
+''')
+_ABOUT_HTML_BYTES = _ABOUT_HTML.encode('utf-8')
 
-  <footer class="site-footer">
-    <p>&copy; 2025 Barba.js Project</p>
-  </footer>
-
-  <div class="page-loader">Loading...</div>
-  <div class="transition-curtain"></div>
 
-  <script type="module" src="/src/main.js"></script>
-</body>
-</html>
-'''
+def create_about_html() -> str:
+    """Generate about.html content."""
+    return _ABOUT_HTML
 
 
-def create_contact_html() -> str:
-    """Generate contact.html content."""
-    return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Contact - Barba.js Project</title>
-  <meta name="description" content="Contact page with Barba.js transitions">
-  <link rel="stylesheet" href="/src/style.css">
-</head>
-<body data-barba="wrapper">
-  <header class="site-header">
-    <nav>
-      <a href="/" class="logo">Barba.js</a>
-      <ul>
-        <li><a href="/">Home</a></li>
-        <li><a href="/about.html">About</a></li>
-        <li><a href="/contact.html">Contact</a></li>
-      </ul>
-    </nav>
-  </header>
-
-  <main data-barba="container" data-barba-namespace="contact">
+_CONTACT_HTML = _html_page('Contact', '''  <main data-barba="container" data-barba-namespace="contact">
     <div class="content-page">
       <h1 class="stagger-item">Contact Us</h1>
       <p class="stagger-item">Get in touch to learn more about Barba.js.</p>
@@ -188,23 +154,16 @@ def create_contact_html() -> str:
       </form>
     </div>
   </main>
+''')
+_CONTACT_HTML_BYTES = _CONTACT_HTML.encode('utf-8')
 
-  <footer class="site-footer">
-    <p>&copy; 2025 Barba.js Project</p>
-  </footer>
 
-  <div class="page-loader">Loading...</div>
-  <div class="transition-curtain"></div>
-
-  <script type="module" src="/src/main.js"></script>
-</body>
-</html>
-'''
+def create_contact_html() -> str:
+    """Generate contact.html content."""
+    return _CONTACT_HTML
 
 
-def create_css() -> str:
-    """Generate style.css content."""
-    return '''* {
+_CSS_CONTENT = '''* {
   margin: 0;
   padding: 0;
   box-sizing: border-box;
@@ -409,12 +368,16 @@ body {
   }
 }
 '''
+_CSS_BYTES = _CSS_CONTENT.encode('utf-8')
 
 
-def create_main_js(transition_type: str = 'fade') -> str:
-    """Generate main.js content with specified transition."""
-    transitions_code = {
-        'fade': '''    {
+def create_css() -> str:
+    """Generate style.css content."""
+    return _CSS_CONTENT
+
+
+_TRANSITIONS = {
+    'fade': '''    {
       name: 'fade',
       async leave({ current }) {
         await gsap.to(current.container, {
@@ -433,7 +396,7 @@ def create_main_js(transition_type: str = 'fade') -> str:
       }
     }''',
 
-        'slide': '''    {
+    'slide': '''    {
       name: 'slide',
       sync: true,
       leave({ current }) {
@@ -453,7 +416,7 @@ def create_main_js(transition_type: str = 'fade') -> str:
       }
     }''',
 
-        'scale': '''    {
+    'scale': '''    {
       name: 'scale-fade',
       async leave({ current }) {
         await gsap.to(current.container, {
@@ -471,7 +434,7 @@ def create_main_js(transition_type: str = 'fade') -> str:
       }
     }''',
 
-        'stagger': '''    {
+    'stagger': '''    {
       name: 'stagger',
       async leave({ current }) {
         const tl = gsap.timeline();
@@ -505,7 +468,7 @@ def create_main_js(transition_type: str = 'fade') -> str:
       }
     }''',
 
-        'curtain': '''    {
+    'curtain': '''    {
       name: 'curtain',
       async leave({ current }) {
         const curtain = document.querySelector('.transition-curtain');
@@ -523,11 +486,13 @@ def create_main_js(transition_type: str = 'fade') -> str:
         });
       }
     }'''
-    }
+}
+
+# Valid --transition values, built once for O(1) membership checks
+_TRANSITION_CHOICES = frozenset(_TRANSITIONS)
 
-    transition_code = transitions_code.get(transition_type, transitions_code['fade'])
 
-    return f'''import barba from '@barba/core';
+_MAIN_JS_TEMPLATE = '''import barba from '@barba/core';
 import gsap from 'gsap';
 
 // Initialize Barba.js
@@ -563,9 +528,21 @@ document.addEventListener('submit', (e) => {{
 '''
 
 
-def create_vite_config() -> str:
-    """Generate vite.config.js content."""
-    return '''import { defineConfig } from 'vite';
+@lru_cache(maxsize=len(_TRANSITIONS))
+def create_main_js(transition_type: str = 'fade') -> str:
+    """Generate main.js content with specified transition."""
+    transition_code = _TRANSITIONS.get(transition_type, _TRANSITIONS['fade'])
+
+    return _MAIN_JS_TEMPLATE.format(transition_code=transition_code)
+
+
+@lru_cache(maxsize=len(_TRANSITIONS))
+def _main_js_bytes(transition_type: str) -> bytes:
+    """Encoded main.js for a transition, cached for repeated project creation."""
+    return create_main_js(transition_type).encode('utf-8')
+
+
+_VITE_CONFIG = '''import { defineConfig } from 'vite';
 
 export default defineConfig({
   build: {
@@ -579,11 +556,15 @@ export default defineConfig({
   }
 });
 '''
+_VITE_CONFIG_BYTES = _VITE_CONFIG.encode('utf-8')
 
 
-def create_readme(project_name: str) -> str:
-    """Generate README.md content."""
-    return f'''# {project_name}
+def create_vite_config() -> str:
+    """Generate vite.config.js content."""
+    return _VITE_CONFIG
+
+
+_README_TEMPLATE = '''# __NAME__
 
 Barba.js page transition project with GSAP animations.
 
@@ -624,7 +605,7 @@ npm run preview
 ## Project Structure
 
 ```
-{project_name}/
+__NAME__/
 ├── index.html              # Home page
 ├── about.html              # About page
 ├── contact.html            # Contact page
@@ -660,6 +641,42 @@ See available transition types in the Barba.js documentation.
 '''
 
 
+def create_readme(project_name: str) -> str:
+    """Generate README.md content."""
+    return _README_TEMPLATE.replace('__NAME__', project_name)
+
+
+# Prebuilt project skeleton: files identical for every project, as encoded bytes
+_SKELETON_FILES = (
+    ('index.html', _INDEX_HTML_BYTES),
+    ('src/style.css', _CSS_BYTES),
+    ('vite.config.js', _VITE_CONFIG_BYTES)
+)
+
+_EXAMPLE_PAGE_FILES = (
+    ('about.html', _ABOUT_HTML_BYTES),
+    ('contact.html', _CONTACT_HTML_BYTES)
+)
+
+
+def _fast_write(path: str, content: bytes) -> None:
+    """Write bytes with a bare open/write/close, bypassing buffered text IO."""
+    data = memoryview(content)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _exit_already_exists(project_path: str) -> None:
+    """Report an existing project directory and exit."""
+    print(f"❌ Error: Directory '{project_path}' already exists")
+    sys.exit(1)
+
+
 def create_project(
     name: str,
     output_dir: str = '.',
@@ -668,75 +685,117 @@ def create_project(
     no_install: bool = False
 ) -> None:
     """Create Barba.js project structure."""
-    project_path = Path(output_dir) / name
-
-    # Check if directory exists
-    if project_path.exists():
-        print(f"❌ Error: Directory '{project_path}' already exists")
-        sys.exit(1)
-
-    print(f"🎬 Creating Barba.js project: {name}")
-    print(f"📁 Location: {project_path}")
-    print()
-
-    # Create directories
-    project_path.mkdir(parents=True)
-    (project_path / 'src').mkdir()
-
-    print("✅ Created project directory")
+    project_path = os.path.normpath(os.path.join(output_dir, name))
+    if os.path.lexists(project_path):
+        _exit_already_exists(project_path)
+
+    # Build in a private sibling directory and rename it into place at the end,
+    # so a failed run never leaves a half-populated project behind
+    parent, base = os.path.split(project_path)
+    build_path = os.path.join(parent, f'.{base}.{os.getpid()}.tmp')
+
+    # Output directories this run has to create, deepest first, so a failed
+    # run can take them away again along with the build directory
+    missing = []
+    ancestor = os.path.abspath(parent)
+    while not os.path.lexists(ancestor):
+        missing.append(ancestor)
+        ancestor = os.path.dirname(ancestor)
+
+    # Progress is collected and written in one go rather than print() per line
+    msgs = [
+        f"🎬 Creating Barba.js project: {name}",
+        f"📁 Location: {project_path}",
+        "",
+        "✅ Created project directory"
+    ]
 
     # Create files
-    files = {
-        'package.json': create_package_json(name),
-        'index.html': create_index_html(minimal),
-        'src/style.css': create_css(),
-        'src/main.js': create_main_js(transition),
-        'vite.config.js': create_vite_config(),
-        'README.md': create_readme(name)
-    }
+    # Only the name/transition-dependent files are generated; the rest is skeleton
+    # (path, content) pairs; only ever iterated, so a flat tuple beats a dict
+    files = (
+        ('package.json', create_package_json(name).encode('utf-8')),
+        ('src/main.js', _main_js_bytes(transition)),
+        ('README.md', create_readme(name).encode('utf-8'))
+    ) + _SKELETON_FILES
 
     if not minimal:
-        files['about.html'] = create_about_html()
-        files['contact.html'] = create_contact_html()
+        files += _EXAMPLE_PAGE_FILES
 
-    for file_path, content in files.items():
-        full_path = project_path / file_path
-        full_path.write_text(content)
-        print(f"✅ Created {file_path}")
+    # Small independent writes; overlap them so slow filesystems pay ~one round trip
+    from concurrent.futures import ThreadPoolExecutor
 
-    print()
-    print("=" * 50)
-    print("✅ Project created successfully!")
-    print()
-    print("Next steps:")
-    print(f"  1. cd {name}")
+    # Join the target paths once, up front, so the workers only write bytes
+    targets = [os.path.join(build_path, file_path) for file_path, _ in files]
+
+    try:
+        os.makedirs(os.path.join(build_path, 'src'))
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            list(executor.map(_fast_write, targets, [content for _, content in files]))
+        # rename() would silently replace an empty directory created meanwhile
+        if os.path.lexists(project_path):
+            raise FileExistsError(project_path)
+        os.rename(build_path, project_path)
+    except BaseException as exc:
+        import shutil
+
+        shutil.rmtree(build_path, ignore_errors=True)
+        for path in missing:
+            try:
+                os.rmdir(path)
+            except OSError:
+                break
+        if isinstance(exc, OSError) and os.path.lexists(project_path):
+            _exit_already_exists(project_path)
+        raise
+
+    msgs.extend(f"✅ Created {file_path}" for file_path, _ in files)
+    msgs += [
+        "",
+        "=" * 50,
+        "✅ Project created successfully!",
+        "",
+        "Next steps:",
+        f"  1. cd {name}"
+    ]
 
     if not no_install:
-        print("  2. Running npm install...")
-        print()
+        import subprocess
+
+        msgs += ["  2. Running npm install...", ""]
+        # npm shares the terminal; everything so far must be out before it starts
+        sys.stdout.write("\n".join(msgs) + "\n")
+        sys.stdout.flush()
+        msgs = []
         try:
             subprocess.run(['npm', 'install'], cwd=project_path, check=True)
-            print()
-            print("✅ Dependencies installed!")
-            print()
-            print("To start development:")
-            print(f"  cd {name}")
-            print("  npm run dev")
+            msgs += [
+                "",
+                "✅ Dependencies installed!",
+                "",
+                "To start development:",
+                f"  cd {name}",
+                "  npm run dev"
+            ]
         except subprocess.CalledProcessError:
-            print("❌ npm install failed. Run manually:")
-            print(f"  cd {name}")
-            print("  npm install")
-            print("  npm run dev")
+            msgs += [
+                "❌ npm install failed. Run manually:",
+                f"  cd {name}",
+                "  npm install",
+                "  npm run dev"
+            ]
         except FileNotFoundError:
-            print("⚠️  npm not found. Install dependencies manually:")
-            print(f"  cd {name}")
-            print("  npm install")
-            print("  npm run dev")
+            msgs += [
+                "⚠️  npm not found. Install dependencies manually:",
+                f"  cd {name}",
+                "  npm install",
+                "  npm run dev"
+            ]
     else:
-        print("  2. npm install")
-        print("  3. npm run dev")
+        msgs += ["  2. npm install", "  3. npm run dev"]
 
-    print()
+    msgs.append("")
+    sys.stdout.write("\n".join(msgs) + "\n")
 
 
 def interactive_mode():
@@ -745,8 +804,19 @@ def interactive_mode():
     print("=" * 50)
     print()
 
+    # Scripted runs pipe all answers at once; read them in one go instead of
+    # one input() round trip per prompt
+    if sys.stdin.isatty():
+        ask = input
+    else:
+        answers = iter(sys.stdin.read().splitlines())
+
+        def ask(prompt: str) -> str:
+            sys.stdout.write(prompt)
+            return next(answers, '')
+
     # Project name
-    name = input("Project name: ").strip()
+    name = ask("Project name: ").strip()
     if not name:
         print("❌ Project name is required")
         sys.exit(1)
@@ -760,7 +830,7 @@ def interactive_mode():
     print("  4. stagger (staggered elements)")
     print("  5. curtain (curtain overlay)")
     print()
-    transition_choice = input("Select transition (1-5, default: 1): ").strip()
+    transition_choice = ask("Select transition (1-5, default: 1): ").strip()
 
     transitions = ['fade', 'slide', 'scale', 'stagger', 'curtain']
     try:
@@ -771,12 +841,12 @@ def interactive_mode():
 
     # Minimal setup
     print()
-    minimal_input = input("Minimal setup? (no example pages) [y/N]: ").strip().lower()
+    minimal_input = ask("Minimal setup? (no example pages) [y/N]: ").strip().lower()
     minimal = minimal_input in ['y', 'yes']
 
     # Install dependencies
     print()
-    no_install_input = input("Skip npm install? [y/N]: ").strip().lower()
+    no_install_input = ask("Skip npm install? [y/N]: ").strip().lower()
     no_install = no_install_input in ['y', 'yes']
 
     print()
@@ -787,8 +857,42 @@ def interactive_mode():
     create_project(name, '.', transition, minimal, no_install)
 
 
-def main():
-    """Main entry point."""
+def _parse_simple_args(argv: list) -> Optional[dict]:
+    """Parse the supported flags without argparse.
+
+    Returns None for anything unusual (--help, unknown or abbreviated flags,
+    missing values, invalid transitions) so argparse can handle and report it.
+    """
+    options = {
+        'name': None,
+        'transition': 'fade',
+        'minimal': False,
+        'no_install': False,
+        'output_dir': '.'
+    }
+    args = iter(argv)
+    for arg in args:
+        flag, has_value, value = arg.partition('=')
+        if flag in ('--minimal', '--no-install') and not has_value:
+            options[flag[2:].replace('-', '_')] = True
+        elif flag in ('--name', '--transition', '--output-dir'):
+            if not has_value:
+                value = next(args, None)
+                if value is None or value.startswith('-'):
+                    return None
+            options[flag[2:].replace('-', '_')] = value
+        else:
+            return None
+
+    if options['transition'] not in _TRANSITION_CHOICES:
+        return None
+    return options
+
+
+def _parse_args_with_argparse() -> dict:
+    """Full argparse CLI, used for help output and error reporting."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Initialize a new Barba.js project',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -800,9 +904,11 @@ def main():
         help='Project directory name'
     )
 
+    # Validated against _TRANSITION_CHOICES after parsing; the metavar keeps
+    # the documented order, which a frozenset would not
     parser.add_argument(
         '--transition',
-        choices=['fade', 'slide', 'scale', 'stagger', 'curtain'],
+        metavar='{%s}' % ','.join(_TRANSITIONS),
         default='fade',
         help='Transition type (default: fade)'
     )
@@ -826,19 +932,31 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.transition not in _TRANSITION_CHOICES:
+        parser.error('argument --transition: invalid choice: %r (choose from %s)' % (
+            args.transition, ', '.join(map(repr, _TRANSITIONS))))
+
+    return vars(args)
+
+
+def main():
+    """Main entry point."""
+    options = _parse_simple_args(sys.argv[1:])
+    if options is None:
+        options = _parse_args_with_argparse()
 
     # Interactive mode if no name specified
-    if not args.name:
+    if not options['name']:
         interactive_mode()
         return
 
     # CLI mode
     create_project(
-        args.name,
-        args.output_dir,
-        args.transition,
-        args.minimal,
-        args.no_install
+        options['name'],
+        options['output_dir'],
+        options['transition'],
+        options['minimal'],
+        options['no_install']
     )
 
 
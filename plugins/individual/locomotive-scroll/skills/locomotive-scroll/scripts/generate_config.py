@@ -12,7 +12,9 @@ Usage:
 """
 
 import sys
-import json
+from functools import lru_cache
+from collections.abc import Mapping
+from types import MappingProxyType
 
 PRESETS = {
     "basic": {
@@ -73,32 +75,132 @@ PRESETS = {
 }
 
 
+def _freeze(value):
+    """Recursively convert dicts/lists to read-only mappings/tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Read-only snapshot of PRESETS for internal lookups; cached output is built
+# from it, so edits to the public dict cannot make the cache go stale
+_FROZEN_PRESETS = _freeze(PRESETS)
+
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Locomotive Scroll</title>
+  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/locomotive-scroll/dist/locomotive-scroll.min.css">
+  <style>
+    * {
+      margin: 0;
+      padding: 0;
+      box-sizing: border-box;
+    }
+
+    [data-scroll-container] {
+      /* Container styles */
+    }
+
+    [data-scroll-section] {
+      min-height: 100vh;
+      padding: 4rem 2rem;
+    }
+
+    .is-inview {
+      opacity: 1;
+      transform: translateY(0);
+      transition: opacity 0.6s, transform 0.6s;
+    }
+
+    [data-scroll] {
+      opacity: 0;
+      transform: translateY(50px);
+    }
+  </style>
+</head>
+<body>
+  <div data-scroll-container>
+
+    <div data-scroll-section>
+      <h1 data-scroll data-scroll-speed="2">
+        Locomotive Scroll
+      </h1>
+      <p data-scroll data-scroll-speed="1">
+        Smooth scrolling experience
+      </p>
+    </div>
+
+    <div data-scroll-section>
+      <h2 data-scroll>Section 2</h2>
+      <div data-scroll data-scroll-sticky>
+        Sticky element
+      </div>
+    </div>
+
+    <div data-scroll-section>
+      <h2 data-scroll>Section 3</h2>
+      <p data-scroll data-scroll-call="playVideo">
+        Triggers callback
+      </p>
+    </div>
+
+  </div>
+
+  <script type="module" src="main.js"></script>
+</body>
+</html>
+"""
+
+
+_YES = frozenset(("y", "yes"))
+_NO = frozenset(("n", "no"))
+
+_RULE = "=" * 60
+_DIVIDER = "-" * 60
+
+_HEADER = f"{_RULE}\nLocomotive Scroll Configuration Generator\n{_RULE}\n\n"
+
+
 def print_header():
-    print("=" * 60)
-    print("Locomotive Scroll Configuration Generator")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_HEADER)
 
 
 def print_presets():
-    print("Available Presets:")
-    print()
-    for i, (key, preset) in enumerate(PRESETS.items(), 1):
-        print(f"  {i}. {preset['name']} ({key})")
-    print()
+    lines = ["Available Presets:", ""]
+    lines.extend(
+        f"  {i}. {preset['name']} ({key})"
+        for i, (key, preset) in enumerate(PRESETS.items(), 1)
+    )
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
+
+
+def _mutable_preset(key):
+    """Copy a preset's options, unfreezing the nested mappings callers edit"""
+    return {
+        k: (dict(v) if isinstance(v, Mapping) else v)
+        for k, v in _FROZEN_PRESETS[key]["options"].items()
+    }
 
 
 def get_user_choice(prompt, options, default=None):
     """Get validated user input"""
+    valid = frozenset(options)
+    error = f"Invalid choice. Please choose from: {', '.join(options)}"
     while True:
         if default:
             choice = input(f"{prompt} (default: {default}): ").strip() or default
         else:
             choice = input(f"{prompt}: ").strip()
 
-        if choice in options:
+        if choice in valid:
             return choice
-        print(f"Invalid choice. Please choose from: {', '.join(options)}")
+        print(error)
 
 
 def get_bool_input(prompt, default=True):
@@ -106,9 +208,9 @@ def get_bool_input(prompt, default=True):
     default_str = "Y/n" if default else "y/N"
     while True:
         choice = input(f"{prompt} ({default_str}): ").strip().lower() or ("y" if default else "n")
-        if choice in ["y", "yes"]:
+        if choice in _YES:
             return True
-        elif choice in ["n", "no"]:
+        elif choice in _NO:
             return False
         print("Please enter 'y' or 'n'")
 
@@ -145,7 +247,7 @@ def interactive_config():
             list(PRESETS.keys()),
             default="basic"
         )
-        config = PRESETS[preset_choice]["options"].copy()
+        config = _mutable_preset(preset_choice)
         print(f"\n✅ Starting with '{PRESETS[preset_choice]['name']}' preset\n")
     else:
         config = {}
@@ -220,124 +322,102 @@ def interactive_config():
     return config
 
 
-def generate_js_code(config):
-    """Generate JavaScript initialization code"""
-    code = f"""// Locomotive Scroll Configuration
+# main.js around the options object; fixed text, so no per-call template parsing
+_JS_HEADER = """// Locomotive Scroll Configuration
 import LocomotiveScroll from 'locomotive-scroll';
 import 'locomotive-scroll/dist/locomotive-scroll.css';
 
-const scroll = new LocomotiveScroll({{
+const scroll = new LocomotiveScroll({
   el: document.querySelector('[data-scroll-container]'),
-{format_config_object(config, indent=1)}
-}});
+"""
+
+_JS_FOOTER = """});
 
 // Update on window resize
 let resizeTimer;
-window.addEventListener('resize', () => {{
+window.addEventListener('resize', () => {
   clearTimeout(resizeTimer);
   resizeTimer = setTimeout(() => scroll.update(), 250);
-}});
+});
 
 // Cleanup
 window.addEventListener('beforeunload', () => scroll.destroy());
 
 export default scroll;
 """
-    return code
 
 
-def format_config_object(config, indent=0):
-    """Format configuration object for JavaScript"""
-    lines = []
-    indent_str = "  " * indent
+def write_js_code(config, out):
+    """Stream JavaScript initialization code to a file-like object"""
+    write = out.write
+    write(_JS_HEADER)
+    _format_config_into(write, config, 1)
+    write(_JS_FOOTER)
 
-    for key, value in config.items():
-        if isinstance(value, bool):
-            lines.append(f"{indent_str}{key}: {str(value).lower()},")
-        elif isinstance(value, (int, float)):
-            lines.append(f"{indent_str}{key}: {value},")
-        elif isinstance(value, str):
-            lines.append(f"{indent_str}{key}: '{value}',")
-        elif isinstance(value, list):
-            formatted_list = str(value).replace("'", '"')
-            lines.append(f"{indent_str}{key}: {formatted_list},")
-        elif isinstance(value, dict):
-            lines.append(f"{indent_str}{key}: {{")
-            lines.append(format_config_object(value, indent + 1))
-            lines.append(f"{indent_str}}},")
-
-    return "\n".join(lines)
 
+def generate_js_code(config):
+    """Generate JavaScript initialization code"""
+    out = [_JS_HEADER]
+    _format_config_into(out.append, config, 1)
+    out.append(_JS_FOOTER)
+    return "".join(out)
 
-def generate_html_template():
-    """Generate HTML template"""
-    return """<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Locomotive Scroll</title>
-  <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/locomotive-scroll/dist/locomotive-scroll.min.css">
-  <style>
-    * {
-      margin: 0;
-      padding: 0;
-      box-sizing: border-box;
-    }
 
-    [data-scroll-container] {
-      /* Container styles */
-    }
+@lru_cache(maxsize=16)
+def _js_for_preset(preset_key):
+    """Generate (once) the JavaScript code for a built-in preset"""
+    return generate_js_code(_FROZEN_PRESETS[preset_key]["options"])
 
-    [data-scroll-section] {
-      min-height: 100vh;
-      padding: 4rem 2rem;
-    }
 
-    .is-inview {
-      opacity: 1;
-      transform: translateY(0);
-      transition: opacity 0.6s, transform 0.6s;
-    }
+def _format_list(value):
+    # Lists are valid JSON literals; let the C encoder serialize them
+    import json
 
-    [data-scroll] {
-      opacity: 0;
-      transform: translateY(50px);
-    }
-  </style>
-</head>
-<body>
-  <div data-scroll-container>
+    return json.dumps(value, ensure_ascii=False)
 
-    <div data-scroll-section>
-      <h1 data-scroll data-scroll-speed="2">
-        Locomotive Scroll
-      </h1>
-      <p data-scroll data-scroll-speed="1">
-        Smooth scrolling experience
-      </p>
-    </div>
 
-    <div data-scroll-section>
-      <h2 data-scroll>Section 2</h2>
-      <div data-scroll data-scroll-sticky>
-        Sticky element
-      </div>
-    </div>
+# Leaf value formatters keyed on exact type(), so bool never falls through to int
+_VALUE_FORMATTERS = {
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: "'{}'".format,
+    list: _format_list,
+    tuple: _format_list,
+}
 
-    <div data-scroll-section>
-      <h2 data-scroll>Section 3</h2>
-      <p data-scroll data-scroll-call="playVideo">
-        Triggers callback
-      </p>
-    </div>
+# Indent prefixes for the nesting depths configs actually reach
+_INDENTS = tuple("  " * i for i in range(16))
 
-  </div>
+_ENTRY_FMT = "{}{}: {},\n".format
+_OPEN_FMT = "{}{}: {{\n".format
+_CLOSE_FMT = "{}}},\n".format
 
-  <script type="module" src="main.js"></script>
-</body>
-</html>
-"""
+
+def _format_config_into(write, config, indent):
+    """Write formatted config entries, one terminated line per write() call"""
+    indent_str = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
+
+    for key, value in config.items():
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            write(_ENTRY_FMT(indent_str, key, formatter(value)))
+        elif isinstance(value, Mapping):
+            write(_OPEN_FMT(indent_str, key))
+            _format_config_into(write, value, indent + 1)
+            write(_CLOSE_FMT(indent_str))
+
+
+def format_config_object(config, indent=0):
+    """Format configuration object for JavaScript"""
+    out = []
+    _format_config_into(out.append, config, indent)
+    return "".join(out)[:-1]
+
+
+def generate_html_template():
+    """Generate HTML template"""
+    return _HTML_TEMPLATE
 
 
 def main():
@@ -347,7 +427,8 @@ def main():
         arg = sys.argv[1].lstrip('-')
 
         if arg in PRESETS:
-            config = PRESETS[arg]["options"].copy()
+            config = _mutable_preset(arg)
+            js_code = _js_for_preset(arg)
             print(f"✅ Using '{PRESETS[arg]['name']}' preset")
         elif arg == "help":
             print(__doc__)
@@ -359,37 +440,44 @@ def main():
     else:
         # Interactive mode
         config = interactive_config()
+        js_code = None
 
-    # Generate code
-    print("\n" + "=" * 60)
-    print("Generated Configuration")
-    print("=" * 60 + "\n")
+    def emit_js(out):
+        # Presets reuse their cached code; custom configs stream straight out
+        if js_code is None:
+            write_js_code(config, out)
+        else:
+            out.write(js_code)
 
-    js_code = generate_js_code(config)
-    print("JavaScript (main.js):")
-    print("-" * 60)
-    print(js_code)
+    # Generate code; each section goes out in a single write
+    sys.stdout.write(
+        f"\n{_RULE}\nGenerated Configuration\n{_RULE}\n\n"
+        f"JavaScript (main.js):\n{_DIVIDER}\n"
+    )
+    emit_js(sys.stdout)
+    sys.stdout.write("\n")
 
     # Ask if user wants HTML template
+    html = generate_html_template()
     if get_bool_input("\nGenerate HTML template?", default=True):
-        html = generate_html_template()
-        print("\nHTML (index.html):")
-        print("-" * 60)
-        print(html)
+        sys.stdout.write(f"\nHTML (index.html):\n{_DIVIDER}\n{html}\n")
 
     # Save to files?
     if get_bool_input("\nSave to files?", default=True):
-        with open("locomotive-config.js", "w") as f:
-            f.write(js_code)
+        with open("locomotive-config.js", "w", buffering=1 << 16) as f:
+            emit_js(f)
         print("✅ Saved to locomotive-config.js")
 
         with open("locomotive-template.html", "w") as f:
-            f.write(generate_html_template())
+            f.write(html)
         print("✅ Saved to locomotive-template.html")
 
-        # Save config as JSON
+        # Save config as JSON; serialize up front so it is a single write
+        # rather than json.dump()'s one write per token
+        import json
+
         with open("locomotive-config.json", "w") as f:
-            json.dump(config, f, indent=2)
+            f.write(json.dumps(config, indent=2))
         print("✅ Saved to locomotive-config.json")
 
     print("\n✅ Done!")
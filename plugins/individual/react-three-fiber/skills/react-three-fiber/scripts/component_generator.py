@@ -37,14 +37,75 @@ Options:
     --framework: Target framework (vanilla, nextjs, vite)
 """
 
-import argparse
+import io
+import re
 import sys
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional
 
 
+# Separator for comma-separated CLI lists; tolerates "a, b" as well as "a,b"
+_LIST_SEP = re.compile(r'\s*,\s*')
+
+# TypeScript types inferred from common prop names
+_VEC3 = '[number, number, number]'
+_PROP_TYPES = {
+    'position': _VEC3,
+    'rotation': _VEC3,
+    'scale': _VEC3,
+    'color': 'string',
+    'modelPath': 'string',
+    'name': 'string',
+    'visible': 'boolean',
+    'castShadow': 'boolean',
+    'receiveShadow': 'boolean',
+}
+
+
+def _infer_prop_type(prop: str) -> str:
+    """Infer a TypeScript type for a prop from its name."""
+    prop_type = _PROP_TYPES.get(prop)
+    if prop_type is None:
+        prop_type = 'React.RefObject<THREE.Mesh>' if prop.endswith('Ref') else 'any'
+    return prop_type
+
+
+def _render_event_handler(event: str) -> str:
+    """Render a logging handler prop for an event name such as 'onClick' or 'click'."""
+    if event.startswith('on'):
+        return f'{event}={{(e) => console.log("{event[2:].lower()}", e)}}'
+    return f'on{event[:1].upper()}{event[1:]}={{(e) => console.log("{event}", e)}}'
+
+
+# Pre-rendered handlers for the R3F pointer event vocabulary, keyed by both the
+# prop form ('onPointerOver') and the bare form ('pointerOver')
+_R3F_EVENTS = (
+    'onClick', 'onContextMenu', 'onDoubleClick', 'onWheel',
+    'onPointerUp', 'onPointerDown', 'onPointerOver', 'onPointerOut',
+    'onPointerEnter', 'onPointerLeave', 'onPointerMove', 'onPointerMissed',
+)
+_EVENT_HANDLERS = {
+    name: _render_event_handler(name)
+    for event in _R3F_EVENTS
+    for name in (event, event[2].lower() + event[3:])
+}
+
+
+@lru_cache(maxsize=64)
+def _render_default(component_type: str, name: str, typescript: bool, drei: bool) -> str:
+    """Render (once) a component without props, events or animation targets."""
+    return R3FComponentGenerator(component_type, name, typescript, drei=drei)._render()
+
+
 class R3FComponentGenerator:
     """Generate React Three Fiber component boilerplate."""
 
+    __slots__ = (
+        'component_type', 'name', 'typescript', 'props', 'events', 'animation',
+        'drei', 'framework', '_mesh_ref', '_group_ref', '_instanced_ref', '_ts_annot',
+    )
+
     def __init__(
         self,
         component_type: str,
@@ -65,8 +126,20 @@ class R3FComponentGenerator:
         self.drei = drei
         self.framework = framework
 
+        # useRef() arguments and props annotation, fixed per instance
+        self._mesh_ref = '<THREE.Mesh>(null!)' if typescript else '()'
+        self._group_ref = '<THREE.Group>(null!)' if typescript else '()'
+        self._instanced_ref = '<THREE.InstancedMesh>(null!)' if typescript else '()'
+        self._ts_annot = f': {name}Props' if typescript else ''
+
     def generate(self) -> str:
         """Generate component code."""
+        if not (self.props or self.events or self.animation):
+            return _render_default(self.component_type, self.name, self.typescript, self.drei)
+        return self._render()
+
+    def _render(self) -> str:
+        """Dispatch to the generator for this component type."""
         generators = {
             'box': self._generate_box,
             'sphere': self._generate_sphere,
@@ -95,7 +168,7 @@ class R3FComponentGenerator:
         r3f_imports = ["useFrame", "useThree"]
         if additional:
             r3f_imports.extend(additional)
-        imports.append(f"import {{ {', '.join(set(r3f_imports))} }} from '@react-three/fiber'")
+        imports.append(f"import {{ {', '.join(dict.fromkeys(r3f_imports))} }} from '@react-three/fiber'")
 
         if self.drei:
             drei_imports = ["OrbitControls", "Environment", "useGLTF"]
@@ -111,21 +184,8 @@ class R3FComponentGenerator:
         if not self.typescript or not self.props:
             return ""
 
-        props_lines = []
-        for prop in self.props:
-            # Infer types from common prop names
-            if prop in ['position', 'rotation', 'scale']:
-                props_lines.append(f"  {prop}?: [number, number, number]")
-            elif prop in ['color', 'modelPath', 'name']:
-                props_lines.append(f"  {prop}?: string")
-            elif prop in ['visible', 'castShadow', 'receiveShadow']:
-                props_lines.append(f"  {prop}?: boolean")
-            elif prop.endswith('Ref'):
-                props_lines.append(f"  {prop}?: React.RefObject<THREE.Mesh>")
-            else:
-                props_lines.append(f"  {prop}?: any")
-
-        return f"\ninterface {self.name}Props {{\n" + "\n".join(props_lines) + "\n}\n"
+        props_lines = "\n".join("  %s?: %s" % (prop, _infer_prop_type(prop)) for prop in self.props)
+        return "\ninterface %sProps {\n%s\n}\n" % (self.name, props_lines)
 
     def _get_props_signature(self) -> str:
         """Generate props parameter signature."""
@@ -142,47 +202,39 @@ class R3FComponentGenerator:
         if not self.events:
             return ""
 
-        handlers = []
-        for event in self.events:
-            if event.startswith('on'):
-                handler_name = event[2:].lower()
-                handlers.append(f'{event}={(e) => console.log("{handler_name}", e)}')
-            else:
-                handlers.append(f'on{event.capitalize()}={(e) => console.log("{event}", e)}')
-
+        handlers = [
+            _EVENT_HANDLERS.get(event) or _render_event_handler(event)
+            for event in self.events
+        ]
         return "\n      ".join(handlers)
 
+    def _render_component(self, body: str, imports: Optional[str] = None) -> str:
+        """Wrap a component body with imports, props interface and exported signature."""
+        buf = io.StringIO()
+        buf.write(self._get_imports() if imports is None else imports)
+        buf.write("\n")
+        buf.write(self._get_props_interface())
+        buf.write("\nexport function ")
+        buf.write(self.name)
+        buf.write(self._get_props_signature())
+        buf.write(" {\n")
+        buf.write(body)
+        buf.write("}\n")
+        return buf.getvalue()
+
     def _generate_box(self) -> str:
         """Generate basic box component."""
-        imports = self._get_imports()
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
-        default_props = ["position = [0, 0, 0]", "color = 'orange'"]
-        props_str = ', '.join(default_props + self.props)
-
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  return (
-    <mesh position={{position}}>
-      <boxGeometry args={{[1, 1, 1]}} />
-      <meshStandardMaterial color={{color}} />
+        return self._render_component("""  return (
+    <mesh position={position}>
+      <boxGeometry args={[1, 1, 1]} />
+      <meshStandardMaterial color={color} />
     </mesh>
   )
-}}
-"""
+""")
 
     def _generate_sphere(self) -> str:
         """Generate sphere component."""
-        imports = self._get_imports()
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  const meshRef = useRef{f'<THREE.Mesh>(null)' if self.typescript else '()'}
+        return self._render_component(f"""  const meshRef = useRef{self._mesh_ref}
 
   return (
     <mesh ref={{meshRef}}>
@@ -190,8 +242,7 @@ export function {self.name}{props_sig} {{
       <meshStandardMaterial color="hotpink" />
     </mesh>
   )
-}}
-"""
+""")
 
     def _generate_model(self) -> str:
         """Generate GLTF model loader component."""
@@ -212,7 +263,7 @@ interface {self.name}Props {{
 
         return f"""{chr(10).join(imports)}
 {props_interface}
-function Model({{ modelPath, position = [0, 0, 0], scale = 1 }}{f': {self.name}Props' if self.typescript else ''}) {{
+function Model({{ modelPath, position = [0, 0, 0], scale = 1 }}{self._ts_annot}) {{
   const {{ scene }} = useGLTF(modelPath)
 
   return <primitive object={{scene}} position={{position}} scale={{scale}} />
@@ -221,7 +272,7 @@ function Model({{ modelPath, position = [0, 0, 0], scale = 1 }}{f': {self.name}P
 // Preload the model
 useGLTF.preload('/path/to/model.glb')
 
-export function {self.name}({{ modelPath = '/model.glb', ...props }}{f': {self.name}Props' if self.typescript else ''}) {{
+export function {self.name}({{ modelPath = '/model.glb', ...props }}{self._ts_annot}) {{
   return (
     <Suspense fallback={{null}}>
       <Model modelPath={{modelPath}} {{...props}} />
@@ -233,9 +284,6 @@ export function {self.name}({{ modelPath = '/model.glb', ...props }}{f': {self.n
     def _generate_interactive(self) -> str:
         """Generate interactive component with pointer events."""
         imports = self._get_imports() + "\nimport { useState } from 'react'"
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
         event_handlers = self._get_event_handlers() or """onClick={(e) => {
         e.stopPropagation()
         setActive(!active)
@@ -246,10 +294,7 @@ export function {self.name}({{ modelPath = '/model.glb', ...props }}{f': {self.n
       }}
       onPointerOut={(e) => setHovered(false)}"""
 
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  const [hovered, setHovered] = useState(false)
+        return self._render_component(f"""  const [hovered, setHovered] = useState(false)
   const [active, setActive] = useState(false)
 
   return (
@@ -260,15 +305,10 @@ export function {self.name}{props_sig} {{
       <meshStandardMaterial color={{hovered ? 'hotpink' : 'orange'}} />
     </mesh>
   )
-}}
-"""
+""", imports=imports)
 
     def _generate_animated(self) -> str:
         """Generate animated component with useFrame."""
-        imports = self._get_imports()
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
         # Generate animation code based on targets
         animation_code = []
         if 'rotation' in self.animation or not self.animation:
@@ -282,10 +322,7 @@ export function {self.name}{props_sig} {{
         if not animation_code:
             animation_code = ["// Add your animation logic here"]
 
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  const meshRef = useRef{f'<THREE.Mesh>(null!)' if self.typescript else '()'}
+        return self._render_component(f"""  const meshRef = useRef{self._mesh_ref}
 
   useFrame((state, delta) => {{
     {chr(10).join(f'    {line}' for line in animation_code)}
@@ -297,19 +334,11 @@ export function {self.name}{props_sig} {{
       <meshStandardMaterial color="orange" />
     </mesh>
   )
-}}
-"""
+""")
 
     def _generate_group(self) -> str:
         """Generate group component."""
-        imports = self._get_imports()
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  const groupRef = useRef{f'<THREE.Group>(null!)' if self.typescript else '()'}
+        return self._render_component(f"""  const groupRef = useRef{self._group_ref}
 
   useFrame((state, delta) => {{
     groupRef.current.rotation.y += delta * 0.5
@@ -327,8 +356,7 @@ export function {self.name}{props_sig} {{
       </mesh>
     </group>
   )
-}}
-"""
+""")
 
     def _generate_instanced(self) -> str:
         """Generate instanced mesh component for performance."""
@@ -340,7 +368,7 @@ export function {self.name}{props_sig} {{
         return f"""{chr(10).join(imports)}
 
 export function {self.name}({{ count = 1000 }}) {{
-  const meshRef = useRef{f'<THREE.InstancedMesh>(null!)' if self.typescript else '()'}
+  const meshRef = useRef{self._instanced_ref}
 
   const particles = useMemo(() => {{
     const temp = []
@@ -399,7 +427,7 @@ export function {self.name}({{ count = 1000 }}) {{
         return f"""{chr(10).join(imports)}
 
 export function {self.name}({{ children }}) {{
-  const groupRef = useRef{f'<THREE.Group>(null!)' if self.typescript else '()'}
+  const groupRef = useRef{self._group_ref}
 
   useFrame((state) => {{
     // Smooth camera follow
@@ -489,27 +517,27 @@ import {{ OrbitControls, Environment, ContactShadows }} from '@react-three/drei'
 function Scene() {{
   return (
     <>
-      {/* Lighting */}
+      {{/* Lighting */}}
       <ambientLight intensity={{0.5}} />
       <directionalLight position={{[5, 5, 5]}} intensity={{1}} castShadow />
 
-      {/* 3D Objects */}
+      {{/* 3D Objects */}}
       <mesh position={{[0, 1, 0]}} castShadow>
         <boxGeometry args={{[1, 1, 1]}} />
         <meshStandardMaterial color="orange" />
       </mesh>
 
-      {/* Ground */}
+      {{/* Ground */}}
       <mesh rotation={{[-Math.PI / 2, 0, 0]}} position={{[0, 0, 0]}} receiveShadow>
         <planeGeometry args={{[10, 10]}} />
         <meshStandardMaterial color="#808080" />
       </mesh>
 
-      {/* Environment */}
+      {{/* Environment */}}
       <Environment preset="city" />
       <ContactShadows position={{[0, 0, 0]}} opacity={{0.5}} scale={{10}} blur={{1}} far={{10}} />
 
-      {/* Camera Controls */}
+      {{/* Camera Controls */}}
       <OrbitControls makeDefault />
     </>
   )
@@ -526,14 +554,7 @@ export function {self.name}() {{
 
     def _generate_custom(self) -> str:
         """Generate custom component template."""
-        imports = self._get_imports()
-        props_interface = self._get_props_interface()
-        props_sig = self._get_props_signature()
-
-        return f"""{imports}
-{props_interface}
-export function {self.name}{props_sig} {{
-  const meshRef = useRef{f'<THREE.Mesh>(null!)' if self.typescript else '()'}
+        return self._render_component(f"""  const meshRef = useRef{self._mesh_ref}
 
   // Add your custom logic here
   useFrame((state, delta) => {{
@@ -546,11 +567,12 @@ export function {self.name}{props_sig} {{
       <meshStandardMaterial color="orange" />
     </mesh>
   )
-}}
-"""
+""")
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Generate React Three Fiber component boilerplate',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -613,9 +635,9 @@ def main():
     args = parser.parse_args()
 
     # Parse comma-separated lists
-    props = args.props.split(',') if args.props else []
-    events = args.events.split(',') if args.events else []
-    animation = args.animation.split(',') if args.animation else []
+    props = [sys.intern(p) for p in _LIST_SEP.split(args.props.strip())] if args.props else []
+    events = _LIST_SEP.split(args.events.strip()) if args.events else []
+    animation = _LIST_SEP.split(args.animation.strip()) if args.animation else []
 
     # Generate component
     generator = R3FComponentGenerator(
@@ -634,8 +656,7 @@ def main():
 
         # Output
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(code)
+            Path(args.output).write_text(code, encoding='utf-8', newline='\n')
             print(f"✅ Generated {args.name} component → {args.output}")
         else:
             print(code)